@@ -1,13 +1,15 @@
 """
 Employee use cases
 """
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 import uuid
 from datetime import datetime
 
 from app.domain.entities.employee import Employee, Position
+from app.domain.exceptions import NotFoundError
 from app.domain.interfaces.repositories import IEmployeeRepository, IPositionRepository
-from app.domain.value_objects.common import PersonName, EntityId
+from app.domain.value_objects.common import validate_person_name, validate_entity_id
+from app.domain.value_objects.uuid_batch import uuid4_batch
 
 
 class EmployeeUseCases:
@@ -37,28 +39,65 @@ class EmployeeUseCases:
     ) -> Employee:
         """Create a new employee"""
         # Validate input
-        first_name_vo = PersonName(first_name)
-        last_name_vo = PersonName(last_name)
-        position_id_vo = EntityId(position_id)
+        first_name = validate_person_name(first_name)
+        last_name = validate_person_name(last_name)
+        position_id = validate_entity_id(position_id)
 
         # Verify position exists
         position = await self._position_repository.get_by_id(position_id)
         if not position:
-            raise ValueError(f"Position with ID {position_id} not found")
+            raise NotFoundError(f"Position with ID {position_id} not found")
 
         # Create employee entity
+        now = datetime.utcnow()
         employee = Employee(
             id=uuid.uuid4(),
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-            first_name=str(first_name_vo),
-            last_name=str(last_name_vo),
-            position_id=position_id_vo.value,
+            created_at=now,
+            updated_at=now,
+            first_name=first_name,
+            last_name=last_name,
+            position_id=position_id,
             position=position
         )
 
         return await self._employee_repository.create(employee)
 
+    async def create_many(self, rows: List[Dict[str, Any]]) -> List[Employee]:
+        """Create many employees, each row holding first_name, last_name and position_id"""
+        validated = [
+            (
+                validate_person_name(row["first_name"]),
+                validate_person_name(row["last_name"]),
+                validate_entity_id(row["position_id"])
+            )
+            for row in rows
+        ]
+
+        # Verify all positions exist with one query instead of one per row
+        positions = await self._position_repository.get_many_by_ids(
+            [position_id for _, _, position_id in validated]
+        )
+        for _, _, position_id in validated:
+            if position_id not in positions:
+                raise NotFoundError(f"Position with ID {position_id} not found")
+
+        now = datetime.utcnow()
+        employees = [
+            Employee(
+                id=employee_id,
+                created_at=now,
+                updated_at=now,
+                first_name=first_name,
+                last_name=last_name,
+                position_id=position_id,
+                position=positions[position_id]
+            )
+            for employee_id, (first_name, last_name, position_id)
+            in zip(uuid4_batch(len(validated)), validated)
+        ]
+
+        return await self._employee_repository.bulk_create(employees)
+
     async def update_employee(
         self,
         employee_id: uuid.UUID,
@@ -68,34 +107,37 @@ class EmployeeUseCases:
     ) -> Employee:
         """Update an existing employee"""
         # Validate input
-        first_name_vo = PersonName(first_name)
-        last_name_vo = PersonName(last_name)
-        position_id_vo = EntityId(position_id)
-
-        # Get existing employee
-        employee = await self._employee_repository.get_by_id(employee_id)
-        if not employee:
-            raise ValueError(f"Employee with ID {employee_id} not found")
+        first_name = validate_person_name(first_name)
+        last_name = validate_person_name(last_name)
+        position_id = validate_entity_id(position_id)
 
         # Verify position exists
         position = await self._position_repository.get_by_id(position_id)
         if not position:
-            raise ValueError(f"Position with ID {position_id} not found")
+            raise NotFoundError(f"Position with ID {position_id} not found")
 
-        # Update employee
-        employee.update_personal_info(str(first_name_vo), str(last_name_vo))
-        employee.change_position(position_id_vo.value)
-        employee.position = position
+        # Update employee; created_at is left untouched by the repository
+        employee = Employee(
+            id=employee_id,
+            created_at=None,
+            updated_at=datetime.utcnow(),
+            first_name=first_name,
+            last_name=last_name,
+            position_id=position_id,
+            position=position
+        )
 
-        return await self._employee_repository.update(employee)
+        updated_employee = await self._employee_repository.update_if_exists(employee)
+        if not updated_employee:
+            raise NotFoundError(f"Employee with ID {employee_id} not found")
+        return updated_employee
 
     async def delete_employee(self, employee_id: uuid.UUID) -> bool:
         """Delete an employee"""
-        employee = await self._employee_repository.get_by_id(employee_id)
-        if not employee:
-            raise ValueError(f"Employee with ID {employee_id} not found")
-
-        return await self._employee_repository.delete(employee_id)
+        deleted = await self._employee_repository.delete(employee_id)
+        if not deleted:
+            raise NotFoundError(f"Employee with ID {employee_id} not found")
+        return deleted
 
     async def get_employees_by_position(self, position_id: uuid.UUID) -> List[Employee]:
         """Get all employees in a specific position"""
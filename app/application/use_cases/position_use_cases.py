@@ -6,8 +6,9 @@ import uuid
 from datetime import datetime
 
 from app.domain.entities.employee import Position
+from app.domain.exceptions import NotFoundError
 from app.domain.interfaces.repositories import IPositionRepository, IEmployeeRepository
-from app.domain.value_objects.common import PositionName, EntityId
+from app.domain.value_objects.common import validate_position_name
 
 
 class PositionUseCases:
@@ -36,23 +37,23 @@ class PositionUseCases:
     ) -> Position:
         """Create a new position"""
         # Validate input
-        name_vo = PositionName(name)
-
-        # Check if position with same name already exists
-        existing_position = await self._position_repository.get_by_name(str(name_vo))
-        if existing_position:
-            raise ValueError(f"Position with name '{name}' already exists")
+        name = validate_position_name(name)
 
         # Create position entity
+        now = datetime.utcnow()
         position = Position(
             id=uuid.uuid4(),
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-            name=str(name_vo),
+            created_at=now,
+            updated_at=now,
+            name=name,
             description=description
         )
 
-        return await self._position_repository.create(position)
+        # The unique name constraint is enforced by the insert itself
+        created_position = await self._position_repository.create_if_unique(position)
+        if not created_position:
+            raise ValueError(f"Position with name '{name}' already exists")
+        return created_position
 
     async def update_position(
         self,
@@ -62,29 +63,29 @@ class PositionUseCases:
     ) -> Position:
         """Update an existing position"""
         # Validate input
-        name_vo = PositionName(name)
-
-        # Get existing position
-        position = await self._position_repository.get_by_id(position_id)
-        if not position:
-            raise ValueError(f"Position with ID {position_id} not found")
+        name = validate_position_name(name)
 
         # Check if another position with same name exists
-        existing_position = await self._position_repository.get_by_name(str(name_vo))
+        existing_position = await self._position_repository.get_by_name(name)
         if existing_position and existing_position.id != position_id:
             raise ValueError(f"Position with name '{name}' already exists")
 
-        # Update position
-        position.update_details(str(name_vo), description)
+        # Update position; created_at is left untouched by the repository
+        position = Position(
+            id=position_id,
+            created_at=None,
+            updated_at=datetime.utcnow(),
+            name=name,
+            description=description
+        )
 
-        return await self._position_repository.update(position)
+        updated_position = await self._position_repository.update_if_exists(position)
+        if not updated_position:
+            raise NotFoundError(f"Position with ID {position_id} not found")
+        return updated_position
 
     async def delete_position(self, position_id: uuid.UUID) -> bool:
         """Delete a position"""
-        position = await self._position_repository.get_by_id(position_id)
-        if not position:
-            raise ValueError(f"Position with ID {position_id} not found")
-
         # Check if any employees are assigned to this position
         has_employees = await self._position_repository.has_employees(position_id)
         if has_employees:
@@ -92,4 +93,7 @@ class PositionUseCases:
                 "Cannot delete position: employees are assigned to this position"
             )
 
-        return await self._position_repository.delete(position_id)
\ No newline at end of file
+        deleted = await self._position_repository.delete(position_id)
+        if not deleted:
+            raise NotFoundError(f"Position with ID {position_id} not found")
+        return deleted
\ No newline at end of file
@@ -6,8 +6,9 @@ import uuid
 from datetime import datetime
 
 from app.domain.entities.employee import User
+from app.domain.exceptions import AlreadyExistsError, NotFoundError
 from app.domain.interfaces.repositories import IUserRepository
-from app.domain.value_objects.common import Username, Email, EntityId
+from app.domain.value_objects.common import validate_username, validate_email
 
 
 class UserUseCases:
@@ -32,34 +33,36 @@ class UserUseCases:
         self,
         username: str,
         email: str,
-        password_hash: str
+        password_hash: str,
+        validate: bool = True
     ) -> User:
-        """Create a new user"""
+        """Create a new user; pass validate=False when the caller has already validated the input"""
         # Validate input
-        username_vo = Username(username)
-        email_vo = Email(email)
-
-        # Check if user already exists
-        existing_user_by_username = await self._user_repository.get_by_username(str(username_vo))
-        if existing_user_by_username:
-            raise ValueError(f"Username '{username}' already exists")
-
-        existing_user_by_email = await self._user_repository.get_by_email(str(email_vo))
-        if existing_user_by_email:
-            raise ValueError(f"Email '{email}' already exists")
+        if validate:
+            username = validate_username(username)
+            email = validate_email(email)
 
         # Create user entity
+        now = datetime.utcnow()
         user = User(
             id=uuid.uuid4(),
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-            username=str(username_vo),
-            email=str(email_vo),
+            created_at=now,
+            updated_at=now,
+            username=username,
+            email=email,
             password_hash=password_hash,
             is_active=True
         )
 
-        return await self._user_repository.create(user)
+        # Unique username/email constraints are enforced by the insert itself;
+        # only a rejected insert pays for the lookup that names the conflict
+        created_user = await self._user_repository.create_if_unique(user)
+        if created_user:
+            return created_user
+
+        if await self._user_repository.get_by_username(username):
+            raise AlreadyExistsError("username", f"Username '{username}' already exists")
+        raise AlreadyExistsError("email", f"Email '{email}' already exists")
 
     async def authenticate_user(self, username: str, password_hash: str) -> Optional[User]:
         """Authenticate user with username and password hash"""
@@ -75,7 +78,7 @@ class UserUseCases:
         """Deactivate a user"""
         user = await self._user_repository.get_by_id(user_id)
         if not user:
-            raise ValueError(f"User with ID {user_id} not found")
+            raise NotFoundError(f"User with ID {user_id} not found")
 
         user.deactivate()
         return await self._user_repository.update(user)
@@ -84,7 +87,7 @@ class UserUseCases:
         """Activate a user"""
         user = await self._user_repository.get_by_id(user_id)
         if not user:
-            raise ValueError(f"User with ID {user_id} not found")
+            raise NotFoundError(f"User with ID {user_id} not found")
 
         user.activate()
         return await self._user_repository.update(user)
\ No newline at end of file
@@ -1,41 +1,98 @@
 """
 Authentication utilities and endpoints
 """
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
+
+import bcrypt
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from passlib.context import CryptContext
-from jose import JWTError, jwt
+from sqlalchemy.ext.asyncio import AsyncSession
+import jwt
+from jwt import PyJWTError
 
-from app.database import get_db
-from app.models import User
+from app.application.use_cases.user_use_cases import UserUseCases
+from app.database import get_async_db
+from app.domain.entities.employee import User as UserEntity
+from app.domain.exceptions import AlreadyExistsError
+from app.infrastructure.cache.redis_cached_user_repo import CachedUserRepository
+from app.infrastructure.cache.redis_client import get_redis
+from app.infrastructure.repositories.user_repository import UserRepository
 from app.schemas import UserCreate, UserResponse, LoginRequest, Token, TokenData
 
 # Configuration
 SECRET_KEY = "your-secret-key-change-in-production"
 ALGORITHM = "HS256"
+# Encoded once; PyJWT otherwise re-encodes a str key on every sign/verify
+_SIGNING_KEY = SECRET_KEY.encode("utf-8")
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 REFRESH_TOKEN_EXPIRE_DAYS = 7
+# bcrypt work factor: each +1 doubles hashing time (2^rounds iterations)
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# Validated token cache: bounded LRU, entries never outlive the token's exp
+TOKEN_CACHE_MAXSIZE = 10_000
+TOKEN_CACHE_TTL_SECONDS = 60
+# bcrypt releases the GIL, so each thread can occupy a core; by default the cores
+# are split between the UVICORN_WORKERS processes instead of oversubscribed
+BCRYPT_THREADS = int(os.getenv(
+    "BCRYPT_THREADS",
+    str(max(1, (os.cpu_count() or 1) // max(1, int(os.getenv("UVICORN_WORKERS", "1")))))
+))
+
+# bcrypt is CPU-bound; run it off the event loop in a dedicated pool
+_BCRYPT_POOL = ThreadPoolExecutor(max_workers=BCRYPT_THREADS, thread_name_prefix="bcrypt")
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# token -> (cache expiry, username, token type)
+_token_cache: "OrderedDict[str, Tuple[float, Optional[str], Optional[str]]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
 
 # Security
 security = HTTPBearer()
 
+# Registration conflicts keep the API's original error messages
+_REGISTER_CONFLICT_DETAILS = {
+    "username": "Username already registered",
+    "email": "Email already registered"
+}
+
 router = APIRouter()
 
 
+def _bcrypt_secret(password: str) -> bytes:
+    """Encode a password for bcrypt, which only uses the first 72 bytes"""
+    return password.encode("utf-8")[:72]
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+    return bcrypt.checkpw(_bcrypt_secret(plain_password), hashed_password.encode("utf-8"))
 
 
 def get_password_hash(password: str) -> str:
     """Hash a password"""
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(
+        _bcrypt_secret(password), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    ).decode("utf-8")
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _BCRYPT_POOL, verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_BCRYPT_POOL, get_password_hash, password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
@@ -46,7 +103,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     else:
         expire = datetime.utcnow() + timedelta(minutes=15)
     to_encode.update({"exp": expire, "type": "access"})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _SIGNING_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
@@ -58,48 +115,60 @@ def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None):
     else:
         expire = datetime.utcnow() + timedelta(days=7)
     to_encode.update({"exp": expire, "type": "refresh"})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _SIGNING_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
-def get_user_by_username(db: Session, username: str):
-    """Get user by username"""
-    return db.query(User).filter(User.username == username).first()
+def decode_token(token: str) -> Tuple[Optional[str], Optional[str]]:
+    """Decode and validate a JWT, returning (username, token type); raises PyJWTError"""
+    now = time.time()
+    with _token_cache_lock:
+        entry = _token_cache.get(token)
+        if entry is not None:
+            if entry[0] > now:
+                _token_cache.move_to_end(token)
+                return entry[1], entry[2]
+            del _token_cache[token]
 
+    payload = jwt.decode(token, _SIGNING_KEY, algorithms=[ALGORITHM])
+    username = payload.get("sub")
+    token_type = payload.get("type")
 
-def get_user_by_email(db: Session, email: str):
-    """Get user by email"""
-    return db.query(User).filter(User.email == email).first()
+    exp = payload.get("exp")
+    ttl = TOKEN_CACHE_TTL_SECONDS if exp is None else min(TOKEN_CACHE_TTL_SECONDS, exp - now)
+    if ttl > 0:
+        with _token_cache_lock:
+            _token_cache[token] = (now + ttl, username, token_type)
+            _token_cache.move_to_end(token)
+            if len(_token_cache) > TOKEN_CACHE_MAXSIZE:
+                _token_cache.popitem(last=False)
+    return username, token_type
 
 
-def create_user(db: Session, user: UserCreate):
-    """Create a new user"""
-    hashed_password = get_password_hash(user.password)
-    db_user = User(
-        username=user.username,
-        email=user.email,
-        password_hash=hashed_password
-    )
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
-    return db_user
-
-
-def authenticate_user(db: Session, username: str, password: str):
-    """Authenticate user with username and password"""
-    user = get_user_by_username(db, username)
-    if not user:
-        return False
-    if not verify_password(password, user.password_hash):
-        return False
-    return user
+def clear_token_cache() -> None:
+    """Drop all cached token validations (e.g. after rotating SECRET_KEY)"""
+    with _token_cache_lock:
+        _token_cache.clear()
+
+
+def get_user_use_cases(db: AsyncSession = Depends(get_async_db)) -> UserUseCases:
+    """Dependency to get user use cases; users served from Redis carry no password hash"""
+    user_repo = UserRepository(db)
+    redis = get_redis()
+    if redis is not None:
+        user_repo = CachedUserRepository(user_repo, redis, db)
+    return UserUseCases(user_repo)
+
+
+def get_credential_use_cases(db: AsyncSession = Depends(get_async_db)) -> UserUseCases:
+    """Dependency to get user use cases that read password hashes from the database"""
+    return UserUseCases(UserRepository(db))
 
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-):
+    user_use_cases: UserUseCases = Depends(get_user_use_cases)
+) -> UserEntity:
     """Get current user from JWT token"""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -108,23 +177,21 @@ async def get_current_user(
     )
     
     try:
-        payload = jwt.decode(credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        token_type: str = payload.get("type")
+        username, token_type = decode_token(credentials.credentials)
         
         if username is None or token_type != "access":
             raise credentials_exception
         token_data = TokenData(username=username)
-    except JWTError:
+    except PyJWTError:
         raise credentials_exception
     
-    user = get_user_by_username(db, username=token_data.username)
+    user = await user_use_cases.get_user_by_username(token_data.username)
     if user is None:
         raise credentials_exception
     return user
 
 
-async def get_current_active_user(current_user: User = Depends(get_current_user)):
+async def get_current_active_user(current_user: UserEntity = Depends(get_current_user)) -> UserEntity:
     """Get current active user"""
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
@@ -132,7 +199,11 @@ async def get_current_active_user(current_user: User = Depends(get_current_user)
 
 
 @router.post("/register", response_model=UserResponse, summary="Register a new user")
-async def register(user: UserCreate, db: Session = Depends(get_db)):
+async def register(
+    user: UserCreate,
+    user_use_cases: UserUseCases = Depends(get_user_use_cases),
+    db: AsyncSession = Depends(get_async_db)
+):
     """
     Register a new user with username, email, and password.
     
@@ -140,31 +211,32 @@ async def register(user: UserCreate, db: Session = Depends(get_db)):
     - **email**: Unique email address
     - **password**: Password for the account
     """
-    # Check if user already exists
-    if get_user_by_username(db, user.username):
-        raise HTTPException(
-            status_code=400,
-            detail="Username already registered"
-        )
-    if get_user_by_email(db, user.email):
-        raise HTTPException(
-            status_code=400,
-            detail="Email already registered"
+    hashed_password = await get_password_hash_async(user.password)
+    try:
+        # UserCreate has already validated the input; duplicate usernames/emails
+        # are rejected by the insert itself
+        created_user = await user_use_cases.create_user(
+            user.username, user.email, hashed_password, validate=False
         )
-    
-    return create_user(db, user)
+    except AlreadyExistsError as e:
+        raise HTTPException(status_code=400, detail=_REGISTER_CONFLICT_DETAILS[e.field])
+    await db.commit()
+    return created_user
 
 
 @router.post("/login", response_model=Token, summary="Login and get tokens")
-async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
+async def login(
+    login_data: LoginRequest,
+    user_use_cases: UserUseCases = Depends(get_credential_use_cases)
+):
     """
     Login with username and password to get access and refresh tokens.
     
     - **username**: Your username
     - **password**: Your password
     """
-    user = authenticate_user(db, login_data.username, login_data.password)
-    if not user:
+    user = await user_use_cases.get_user_by_username(login_data.username)
+    if not user or not await verify_password_async(login_data.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -191,7 +263,7 @@ async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
 @router.post("/refresh", response_model=Token, summary="Refresh access token")
 async def refresh_token(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    user_use_cases: UserUseCases = Depends(get_user_use_cases)
 ):
     """
     Refresh access token using a valid refresh token.
@@ -205,16 +277,14 @@ async def refresh_token(
     )
     
     try:
-        payload = jwt.decode(credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        token_type: str = payload.get("type")
+        username, token_type = decode_token(credentials.credentials)
         
         if username is None or token_type != "refresh":
             raise credentials_exception
-    except JWTError:
+    except PyJWTError:
         raise credentials_exception
     
-    user = get_user_by_username(db, username)
+    user = await user_use_cases.get_user_by_username(username)
     if user is None:
         raise credentials_exception
     
@@ -1,22 +1,116 @@
 """
 Database configuration and session management
 """
-from sqlalchemy import create_engine
+import os
+from typing import Awaitable, Callable
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 # SQLite database URL
 SQLALCHEMY_DATABASE_URL = "sqlite:///./employee_management.db"
+# Same database through the aiosqlite driver, for repositories awaited on the event loop
+SQLALCHEMY_ASYNC_DATABASE_URL = "sqlite+aiosqlite:///./employee_management.db"
+
+# Connection pool: connections are reused across requests instead of opened per request
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+# Seconds a request waits for a free pooled connection before erroring, instead of queueing
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "10"))
+# Number of compiled SQL statements each engine keeps for reuse (SQLAlchemy default 500)
+DB_QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", "1200"))
 
 # Create SQLAlchemy engine
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL, 
-    connect_args={"check_same_thread": False}
+    # timeout: seconds a writer waits on SQLite's database lock before erroring
+    connect_args={"check_same_thread": False, "timeout": 30},
+    # Explicit so pool_size/pool_timeout below always reach a queue pool
+    poolclass=QueuePool,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_pre_ping=True,
+    query_cache_size=DB_QUERY_CACHE_SIZE
+)
+
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune each new SQLite connection once; pooled connections keep the settings"""
+    cursor = dbapi_connection.cursor()
+    # WAL lets readers proceed while a writer commits; NORMAL is durable under WAL
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-20000")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+    # Stop the driver from managing transactions itself; _begin_sqlite_transaction does it,
+    # so SAVEPOINTs nest inside the request's transaction instead of committing on release
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine, "begin")
+def _begin_sqlite_transaction(conn):
+    """Emit BEGIN explicitly whenever SQLAlchemy starts a transaction"""
+    conn.exec_driver_sql("BEGIN")
+
+
+# Create async SQLAlchemy engine; queries are awaited instead of blocking the event loop
+async_engine = create_async_engine(
+    SQLALCHEMY_ASYNC_DATABASE_URL,
+    connect_args={"timeout": 30},
+    # Explicit: older SQLAlchemy 2.0 releases default aiosqlite file URLs to NullPool,
+    # which rejects the sizing arguments below
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_pre_ping=True,
+    query_cache_size=DB_QUERY_CACHE_SIZE
 )
+event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+event.listen(async_engine.sync_engine, "begin", _begin_sqlite_transaction)
+
+_AFTER_COMMIT = "after_commit"
+
+
+class AfterCommitAsyncSession(AsyncSession):
+    """AsyncSession that runs callbacks queued with after_commit() once a commit succeeds"""
+
+    async def commit(self) -> None:
+        await super().commit()
+        for callback in self.info.pop(_AFTER_COMMIT, []):
+            await callback()
+
+    async def rollback(self) -> None:
+        self.info.pop(_AFTER_COMMIT, None)
+        await super().rollback()
+
+    async def close(self) -> None:
+        self.info.pop(_AFTER_COMMIT, None)
+        await super().close()
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], Awaitable[object]]) -> None:
+    """Queue an async callback (e.g. a cache invalidation) to run after the session commits"""
+    session.info.setdefault(_AFTER_COMMIT, []).append(callback)
+
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Loaded objects stay usable after commit; refreshing them would need another await
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AfterCommitAsyncSession, autoflush=False, expire_on_commit=False
+)
+
 # Create Base class for models
 Base = declarative_base()
 
@@ -27,4 +121,12 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def get_async_db():
+    """Dependency to get async database session"""
+    # Repositories only flush; write endpoints commit once, before they respond.
+    # Anything left uncommitted is rolled back when the session closes.
+    async with AsyncSessionLocal() as db:
+        yield db
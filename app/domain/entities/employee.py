@@ -2,13 +2,13 @@
 Domain entities for the Employee Management System
 """
 from abc import ABC
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 import uuid
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseEntity(ABC):
     """Base entity with common properties"""
     id: uuid.UUID
@@ -18,13 +18,15 @@ class BaseEntity(ABC):
     def __post_init__(self):
         if self.id is None:
             self.id = uuid.uuid4()
-        if self.created_at is None:
-            self.created_at = datetime.utcnow()
-        if self.updated_at is None:
-            self.updated_at = datetime.utcnow()
+        if self.created_at is None or self.updated_at is None:
+            now = datetime.utcnow()
+            if self.created_at is None:
+                self.created_at = now
+            if self.updated_at is None:
+                self.updated_at = now
 
 
-@dataclass
+@dataclass(slots=True)
 class User(BaseEntity):
     """User domain entity"""
     username: str
@@ -32,8 +34,27 @@ class User(BaseEntity):
     password_hash: str
     is_active: bool = True
 
-    def __post_init__(self):
-        super().__post_init__()
+    @classmethod
+    def from_row(
+        cls,
+        id: uuid.UUID,
+        created_at: datetime,
+        updated_at: datetime,
+        username: str,
+        email: str,
+        password_hash: str,
+        is_active: bool = True
+    ) -> "User":
+        """Build a user from stored values, skipping __post_init__"""
+        user = object.__new__(cls)
+        user.id = id
+        user.created_at = created_at
+        user.updated_at = updated_at
+        user.username = username
+        user.email = email
+        user.password_hash = password_hash
+        user.is_active = is_active
+        return user
 
     def deactivate(self) -> None:
         """Deactivate the user"""
@@ -46,14 +67,29 @@ class User(BaseEntity):
         self.updated_at = datetime.utcnow()
 
 
-@dataclass
+@dataclass(slots=True)
 class Position(BaseEntity):
     """Position domain entity"""
     name: str
     description: Optional[str] = None
 
-    def __post_init__(self):
-        super().__post_init__()
+    @classmethod
+    def from_row(
+        cls,
+        id: uuid.UUID,
+        created_at: datetime,
+        updated_at: datetime,
+        name: str,
+        description: Optional[str] = None
+    ) -> "Position":
+        """Build a position from stored values, skipping __post_init__"""
+        position = object.__new__(cls)
+        position.id = id
+        position.created_at = created_at
+        position.updated_at = updated_at
+        position.name = name
+        position.description = description
+        return position
 
     def update_details(self, name: str, description: Optional[str] = None) -> None:
         """Update position details"""
@@ -62,26 +98,49 @@ class Position(BaseEntity):
         self.updated_at = datetime.utcnow()
 
 
-@dataclass
+@dataclass(slots=True)
 class Employee(BaseEntity):
     """Employee domain entity"""
     first_name: str
     last_name: str
     position_id: uuid.UUID
     position: Optional[Position] = None
+    # Derived from the name fields; materialized on write instead of per read
+    full_name: str = field(init=False, compare=False)
 
     def __post_init__(self):
-        super().__post_init__()
-
-    @property
-    def full_name(self) -> str:
-        """Get employee's full name"""
-        return f"{self.first_name} {self.last_name}"
+        # Zero-argument super() does not work in slotted dataclasses
+        BaseEntity.__post_init__(self)
+        self.full_name = f"{self.first_name} {self.last_name}"
+
+    @classmethod
+    def from_row(
+        cls,
+        id: uuid.UUID,
+        created_at: datetime,
+        updated_at: datetime,
+        first_name: str,
+        last_name: str,
+        position_id: uuid.UUID,
+        position: Optional[Position] = None
+    ) -> "Employee":
+        """Build an employee from stored values, skipping __post_init__"""
+        employee = object.__new__(cls)
+        employee.id = id
+        employee.created_at = created_at
+        employee.updated_at = updated_at
+        employee.first_name = first_name
+        employee.last_name = last_name
+        employee.full_name = f"{first_name} {last_name}"
+        employee.position_id = position_id
+        employee.position = position
+        return employee
 
     def update_personal_info(self, first_name: str, last_name: str) -> None:
         """Update employee's personal information"""
         self.first_name = first_name
         self.last_name = last_name
+        self.full_name = f"{first_name} {last_name}"
         self.updated_at = datetime.utcnow()
 
     def change_position(self, position_id: uuid.UUID) -> None:
@@ -0,0 +1,15 @@
+"""
+Domain exceptions
+"""
+
+
+class NotFoundError(ValueError):
+    """Raised when a referenced entity does not exist"""
+
+
+class AlreadyExistsError(ValueError):
+    """Raised when a value that must be unique is already taken"""
+
+    def __init__(self, field: str, message: str):
+        super().__init__(message)
+        self.field = field
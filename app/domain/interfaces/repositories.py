@@ -1,115 +1,126 @@
 """
 Repository interfaces for the domain layer
 """
-from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional, Protocol, runtime_checkable
 import uuid
 
 from app.domain.entities.employee import User, Employee, Position
 
 
-class IUserRepository(ABC):
-    """User repository interface"""
+@runtime_checkable
+class IUserRepository(Protocol):
+    """User repository interface, satisfied structurally by implementations"""
 
-    @abstractmethod
     async def get_by_id(self, user_id: uuid.UUID) -> Optional[User]:
         """Get user by ID"""
-        pass
+        ...
 
-    @abstractmethod
     async def get_by_username(self, username: str) -> Optional[User]:
         """Get user by username"""
-        pass
+        ...
 
-    @abstractmethod
     async def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
-        pass
+        ...
 
-    @abstractmethod
     async def create(self, user: User) -> User:
         """Create a new user"""
-        pass
+        ...
+
+    async def create_if_unique(self, user: User) -> Optional[User]:
+        """Create a user, returning None if it violates a uniqueness constraint"""
+        ...
 
-    @abstractmethod
     async def update(self, user: User) -> User:
         """Update an existing user"""
-        pass
+        ...
+
+    async def update_if_exists(self, user: User) -> Optional[User]:
+        """Update a user in one round trip, returning None if it does not exist"""
+        ...
 
-    @abstractmethod
     async def delete(self, user_id: uuid.UUID) -> bool:
         """Delete a user"""
-        pass
+        ...
 
 
-class IEmployeeRepository(ABC):
-    """Employee repository interface"""
+@runtime_checkable
+class IEmployeeRepository(Protocol):
+    """Employee repository interface, satisfied structurally by implementations"""
 
-    @abstractmethod
     async def get_by_id(self, employee_id: uuid.UUID) -> Optional[Employee]:
         """Get employee by ID"""
-        pass
+        ...
 
-    @abstractmethod
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[Employee]:
         """Get all employees with pagination"""
-        pass
+        ...
 
-    @abstractmethod
     async def get_by_position_id(self, position_id: uuid.UUID) -> List[Employee]:
         """Get all employees in a specific position"""
-        pass
+        ...
 
-    @abstractmethod
     async def create(self, employee: Employee) -> Employee:
         """Create a new employee"""
-        pass
+        ...
+
+    async def bulk_create(self, employees: List[Employee]) -> List[Employee]:
+        """Create many employees in a single INSERT"""
+        ...
 
-    @abstractmethod
     async def update(self, employee: Employee) -> Employee:
         """Update an existing employee"""
-        pass
+        ...
+
+    async def update_if_exists(self, employee: Employee) -> Optional[Employee]:
+        """Update an employee in one round trip, returning None if it does not exist"""
+        ...
 
-    @abstractmethod
     async def delete(self, employee_id: uuid.UUID) -> bool:
         """Delete an employee"""
-        pass
+        ...
 
 
-class IPositionRepository(ABC):
-    """Position repository interface"""
+@runtime_checkable
+class IPositionRepository(Protocol):
+    """Position repository interface, satisfied structurally by implementations"""
 
-    @abstractmethod
     async def get_by_id(self, position_id: uuid.UUID) -> Optional[Position]:
         """Get position by ID"""
-        pass
+        ...
+
+    async def get_many_by_ids(self, position_ids: List[uuid.UUID]) -> Dict[uuid.UUID, Position]:
+        """Get positions keyed by ID; IDs that do not exist are omitted"""
+        ...
 
-    @abstractmethod
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[Position]:
         """Get all positions with pagination"""
-        pass
+        ...
 
-    @abstractmethod
     async def get_by_name(self, name: str) -> Optional[Position]:
         """Get position by name"""
-        pass
+        ...
 
-    @abstractmethod
     async def create(self, position: Position) -> Position:
         """Create a new position"""
-        pass
+        ...
+
+    async def create_if_unique(self, position: Position) -> Optional[Position]:
+        """Create a position, returning None if it violates a uniqueness constraint"""
+        ...
 
-    @abstractmethod
     async def update(self, position: Position) -> Position:
         """Update an existing position"""
-        pass
+        ...
+
+    async def update_if_exists(self, position: Position) -> Optional[Position]:
+        """Update a position in one round trip, returning None if it does not exist"""
+        ...
 
-    @abstractmethod
     async def delete(self, position_id: uuid.UUID) -> bool:
         """Delete a position"""
-        pass
+        ...
 
-    @abstractmethod
     async def has_employees(self, position_id: uuid.UUID) -> bool:
         """Check if position has any employees assigned"""
-        pass
\ No newline at end of file
+        ...
\ No newline at end of file
@@ -2,117 +2,148 @@
 Value objects for the domain layer
 """
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Union
 import re
+import string
 import uuid
 
 
-@dataclass(frozen=True)
+# The pattern is compiled once at import time; the bound match method is cached
+# too so each call skips the attribute lookup on the pattern object
+_EMAIL_MATCH = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$').match
+
+# The remaining formats are pure character-class tests, so a C-level set
+# membership scan replaces the regex engine. _WHITESPACE is every character
+# the regex class \s matches (i.e. str.isspace()).
+_WHITESPACE = (
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003"
+    "\u2004\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+_USERNAME_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+_PERSON_NAME_CHARS = frozenset(string.ascii_letters + _WHITESPACE + "-'")
+_POSITION_NAME_CHARS = frozenset(string.ascii_letters + string.digits + _WHITESPACE + "-/()&.")
+
+# Shortest string the email pattern can match: "a@b.cc"
+_EMAIL_MIN_LENGTH = 6
+
+
+def validate_email(email: str) -> str:
+    """Validate an email address and return it unchanged"""
+    if len(email) < _EMAIL_MIN_LENGTH or _EMAIL_MATCH(email) is None:
+        raise ValueError(f"Invalid email format: {email}")
+    return email
+
+
+def validate_username(username: str) -> str:
+    """Validate a username and return it unchanged"""
+    # Allow alphanumeric characters, underscores, and hyphens
+    if not 3 <= len(username) <= 50 or not _USERNAME_CHARS.issuperset(username):
+        raise ValueError(f"Invalid username: {username}")
+    return username
+
+
+def validate_person_name(name: str) -> str:
+    """Validate a person name and return it unchanged"""
+    # Allow letters, spaces, hyphens, and apostrophes
+    if not 1 <= len(name) <= 50 or not _PERSON_NAME_CHARS.issuperset(name):
+        raise ValueError(f"Invalid name: {name}")
+    return name
+
+
+def validate_position_name(name: str) -> str:
+    """Validate a position name and return it unchanged"""
+    # Allow letters, numbers, spaces, hyphens, and some special characters
+    if not 1 <= len(name) <= 100 or not _POSITION_NAME_CHARS.issuperset(name):
+        raise ValueError(f"Invalid position name: {name}")
+    return name
+
+
+def validate_entity_id(value: Union[uuid.UUID, bytes]) -> uuid.UUID:
+    """Validate an entity ID, accepting a UUID or its 16 raw bytes"""
+    if isinstance(value, uuid.UUID):
+        return value
+    if isinstance(value, bytes) and len(value) == 16:
+        return uuid.UUID(bytes=value)
+    raise ValueError("ID must be a valid UUID")
+
+
+@dataclass(frozen=True, slots=True)
 class Email:
     """Email value object with validation"""
     value: str
 
     def __post_init__(self):
-        if not self._is_valid_email(self.value):
-            raise ValueError(f"Invalid email format: {self.value}")
-
-    @staticmethod
-    def _is_valid_email(email: str) -> bool:
-        """Validate email format"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        validate_email(self.value)
 
     def __str__(self) -> str:
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Username:
     """Username value object with validation"""
     value: str
 
     def __post_init__(self):
-        if not self._is_valid_username(self.value):
-            raise ValueError(f"Invalid username: {self.value}")
-
-    @staticmethod
-    def _is_valid_username(username: str) -> bool:
-        """Validate username format"""
-        if len(username) < 3 or len(username) > 50:
-            return False
-        # Allow alphanumeric characters, underscores, and hyphens
-        pattern = r'^[a-zA-Z0-9_-]+$'
-        return re.match(pattern, username) is not None
+        validate_username(self.value)
 
     def __str__(self) -> str:
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PersonName:
     """Person name value object with validation"""
     value: str
 
     def __post_init__(self):
-        if not self._is_valid_name(self.value):
-            raise ValueError(f"Invalid name: {self.value}")
-
-    @staticmethod
-    def _is_valid_name(name: str) -> bool:
-        """Validate name format"""
-        if len(name) < 1 or len(name) > 50:
-            return False
-        # Allow letters, spaces, hyphens, and apostrophes
-        pattern = r"^[a-zA-Z\s\-']+$"
-        return re.match(pattern, name) is not None
+        validate_person_name(self.value)
 
     def __str__(self) -> str:
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EntityId:
     """Entity ID value object"""
     value: uuid.UUID
 
     def __post_init__(self):
-        if not isinstance(self.value, uuid.UUID):
-            raise ValueError("ID must be a valid UUID")
+        # Normalize raw 16-byte IDs so .value is always a UUID
+        object.__setattr__(self, "value", validate_entity_id(self.value))
 
     def __str__(self) -> str:
         return str(self.value)
 
+    @classmethod
+    def _from_uuid(cls, value: uuid.UUID) -> 'EntityId':
+        """Wrap a value already known to be a UUID, skipping __init__/__post_init__"""
+        entity_id = object.__new__(cls)
+        object.__setattr__(entity_id, "value", value)
+        return entity_id
+
     @classmethod
     def generate(cls) -> 'EntityId':
         """Generate a new random EntityId"""
-        return cls(uuid.uuid4())
+        return cls._from_uuid(uuid.uuid4())
 
     @classmethod
     def from_string(cls, id_str: str) -> 'EntityId':
         """Create EntityId from string"""
         try:
-            return cls(uuid.UUID(id_str))
+            value = uuid.UUID(id_str)
         except ValueError as e:
             raise ValueError(f"Invalid UUID string: {id_str}") from e
+        return cls._from_uuid(value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PositionName:
     """Position name value object with validation"""
     value: str
 
     def __post_init__(self):
-        if not self._is_valid_position_name(self.value):
-            raise ValueError(f"Invalid position name: {self.value}")
-
-    @staticmethod
-    def _is_valid_position_name(name: str) -> bool:
-        """Validate position name format"""
-        if len(name) < 1 or len(name) > 100:
-            return False
-        # Allow letters, numbers, spaces, hyphens, and some special characters
-        pattern = r"^[a-zA-Z0-9\s\-/()&.]+$"
-        return re.match(pattern, name) is not None
+        validate_position_name(self.value)
 
     def __str__(self) -> str:
         return self.value
\ No newline at end of file
@@ -0,0 +1,13 @@
+"""
+Batched random UUID generation
+"""
+from typing import List
+import os
+import uuid
+
+
+def uuid4_batch(n: int) -> List[uuid.UUID]:
+    """Generate n random (version 4) UUIDs from a single os.urandom call"""
+    buf = os.urandom(16 * n)
+    # version=4 sets the version and variant bits exactly as uuid.uuid4() does
+    return [uuid.UUID(bytes=buf[i:i + 16], version=4) for i in range(0, 16 * n, 16)]
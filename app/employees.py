@@ -1,23 +1,70 @@
 """
 Employee management endpoints
 """
-from typing import List
+from typing import List, Optional
+import uuid
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse, Response
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
-from app.database import get_db
-from app.models import Employee, User
+from app.database import get_async_db
+from app.infrastructure.cache.redis_list_cache import ListCache, get_employee_list_cache
+from app.models import Employee, Position, User
 from app.schemas import EmployeeCreate, EmployeeUpdate, EmployeeResponse
 from app.auth import get_current_active_user
 
 router = APIRouter()
 
+# Flat employee + position projection for the list endpoint
+_EMPLOYEE_LIST = (
+    select(
+        Employee.id,
+        Employee.first_name,
+        Employee.last_name,
+        Employee.position_id,
+        Employee.created_at,
+        Employee.updated_at,
+        Position.id,
+        Position.name,
+        Position.description,
+        Position.created_at,
+        Position.updated_at
+    )
+    .outerjoin(Position, Employee.position_id == Position.id)
+)
+
+
+def _employee_row_to_dict(row) -> dict:
+    """Shape a projected row like EmployeeResponse without running its validators"""
+    # One unpack and a dict literal; cheaper per row than zipping field-name tuples
+    (id, first_name, last_name, position_id, created_at, updated_at,
+     pos_id, pos_name, pos_description, pos_created_at, pos_updated_at) = row
+    return {
+        "id": id,
+        "first_name": first_name,
+        "last_name": last_name,
+        "position_id": position_id,
+        "created_at": created_at,
+        "updated_at": updated_at,
+        "position": None if pos_id is None else {
+            "id": pos_id,
+            "name": pos_name,
+            "description": pos_description,
+            "created_at": pos_created_at,
+            "updated_at": pos_updated_at
+        },
+        "full_name": f"{first_name} {last_name}"
+    }
+
 
 @router.get("/", response_model=List[EmployeeResponse], summary="Get all employees")
 async def get_employees(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
+    list_cache: Optional[ListCache] = Depends(get_employee_list_cache),
     current_user: User = Depends(get_current_active_user)
 ):
     """
@@ -26,21 +73,30 @@ async def get_employees(
     - **skip**: Number of records to skip (default: 0)
     - **limit**: Maximum number of records to return (default: 100)
     """
-    employees = db.query(Employee).offset(skip).limit(limit).all()
-    return employees
+    if list_cache is not None:
+        body = await list_cache.get(skip, limit)
+        if body is not None:
+            return Response(body, media_type="application/json")
+
+    # Stored rows are trusted: serialize them directly; response_model only documents the shape
+    rows = (await db.execute(_EMPLOYEE_LIST.offset(skip).limit(limit))).all()
+    response = ORJSONResponse([_employee_row_to_dict(row) for row in rows])
+    if list_cache is not None:
+        await list_cache.set(skip, limit, response.body)
+    return response
 
 
 @router.get("/{id}", response_model=EmployeeResponse, summary="Get employee by ID")
 async def get_employee_by_id(
-    id: str,
-    db: Session = Depends(get_db),
+    id: uuid.UUID,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """
     Get an employee by ID.
     - **id**: The ID of the employee to retrieve
     """
-    employee = db.query(Employee).filter(Employee.id == id).first()
+    employee = await db.get(Employee, id, options=[joinedload(Employee.position)])
     if employee is None:
         raise HTTPException(status_code=404, detail="Employee not found")
     return employee
@@ -49,7 +105,8 @@ async def get_employee_by_id(
 @router.post("/", response_model=EmployeeResponse, summary="Create a new employee")
 async def create_employee(
     employee: EmployeeCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
+    list_cache: Optional[ListCache] = Depends(get_employee_list_cache),
     current_user: User = Depends(get_current_active_user)
 ):
     """
@@ -60,9 +117,9 @@ async def create_employee(
     - **position_id**: ID of the position for this employee
     """
     # Check if position exists
-    from app.models import Position
-    position = db.query(Position).filter(Position.id == employee.position_id).first()
-    if not position:
+    # Probe the key only; SQLite does not enforce the FK unless PRAGMA foreign_keys is on
+    position_exists = await db.scalar(select(Position.id).where(Position.id == employee.position_id))
+    if position_exists is None:
         raise HTTPException(status_code=404, detail="Position not found")
     
     db_employee = Employee(
@@ -71,45 +128,53 @@ async def create_employee(
         position_id=employee.position_id
     )
     db.add(db_employee)
-    db.commit()
-    db.refresh(db_employee)
-    return db_employee
+    await db.commit()
+    if list_cache is not None:
+        await list_cache.invalidate()
+    # Reload server-side timestamps and the position together; lazy loads cannot be awaited
+    return await db.get(
+        Employee, db_employee.id, options=[joinedload(Employee.position)], populate_existing=True
+    )
 
 
 @router.put("/{id}", response_model=EmployeeResponse, summary="Update an employee")
 async def update_employee(
-    id: str,
+    id: uuid.UUID,
     employee_update: EmployeeUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
+    list_cache: Optional[ListCache] = Depends(get_employee_list_cache),
     current_user: User = Depends(get_current_active_user)
 ):
     """
     Update an existing employee.
     - **id**: The ID of the employee to update
     """
-    db_employee = db.query(Employee).filter(Employee.id == id).first()
-    if db_employee is None:
+    # One UPDATE statement; no SELECT, instrumented setters or dirty tracking
+    patch = employee_update.model_dump(exclude_unset=True)
+    result = await db.execute(update(Employee).where(Employee.id == id).values(**patch))
+    await db.commit()
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Employee not found")
-    for key, value in employee_update.dict(exclude_unset=True).items():
-        setattr(db_employee, key, value)
-    db.commit()
-    db.refresh(db_employee)
-    return db_employee
+    if list_cache is not None:
+        await list_cache.invalidate()
+    return await db.get(Employee, id, options=[joinedload(Employee.position)])
 
 
 @router.delete("/{id}", summary="Delete an employee")
 async def delete_employee(
-    id: str,
-    db: Session = Depends(get_db),
+    id: uuid.UUID,
+    db: AsyncSession = Depends(get_async_db),
+    list_cache: Optional[ListCache] = Depends(get_employee_list_cache),
     current_user: User = Depends(get_current_active_user)
 ):
     """
     Delete an employee by ID.
     - **id**: The ID of the employee to delete
     """
-    db_employee = db.query(Employee).filter(Employee.id == id).first()
-    if db_employee is None:
+    result = await db.execute(delete(Employee).where(Employee.id == id))
+    await db.commit()
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Employee not found")
-    db.delete(db_employee)
-    db.commit()
+    if list_cache is not None:
+        await list_cache.invalidate()
     return {"message": "Employee deleted successfully"}
\ No newline at end of file
@@ -0,0 +1,136 @@
+"""
+Redis read-through cache for the position repository
+"""
+from datetime import datetime
+from typing import Dict, List, Optional
+import uuid
+
+import orjson
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import after_commit
+from app.domain.entities.employee import Position
+from app.domain.interfaces.repositories import IPositionRepository
+from app.infrastructure.cache.redis_client import CACHE_TTL_SECONDS, get_redis
+
+
+def position_key(position_id: uuid.UUID) -> str:
+    """Redis key of a cached position"""
+    return f"pos:{position_id}"
+
+
+async def invalidate_cached_position(position_id: uuid.UUID) -> None:
+    """Drop a cached position after a committed write that bypassed CachedPositionRepository"""
+    redis = get_redis()
+    if redis is not None:
+        await redis.delete(position_key(position_id))
+
+
+def _dump(position: Position) -> bytes:
+    return orjson.dumps(position)
+
+
+def _load(raw: bytes) -> Position:
+    data = orjson.loads(raw)
+    return Position.from_row(
+        id=uuid.UUID(data["id"]),
+        created_at=datetime.fromisoformat(data["created_at"]),
+        updated_at=datetime.fromisoformat(data["updated_at"]),
+        name=data["name"],
+        description=data["description"]
+    )
+
+
+class CachedPositionRepository:
+    """Caches position lookups by ID in Redis; writes go to the wrapped repository (IPositionRepository).
+
+    Entries are dropped only after the session commits, so a concurrent read
+    cannot re-cache the row as it was before the write.
+    """
+
+    def __init__(
+        self, inner: IPositionRepository, redis, session: AsyncSession, ttl: int = CACHE_TTL_SECONDS
+    ):
+        self._inner = inner
+        self._redis = redis
+        self._session = session
+        self._ttl = ttl
+
+    async def get_by_id(self, position_id: uuid.UUID) -> Optional[Position]:
+        """Get position by ID, from cache when possible"""
+        raw = await self._redis.get(position_key(position_id))
+        if raw is not None:
+            return _load(raw)
+
+        position = await self._inner.get_by_id(position_id)
+        if position:
+            await self._redis.setex(position_key(position_id), self._ttl, _dump(position))
+        return position
+
+    async def get_many_by_ids(self, position_ids: List[uuid.UUID]) -> Dict[uuid.UUID, Position]:
+        """Get positions keyed by ID, fetching only cache misses from the database"""
+        unique_ids = list(set(position_ids))
+        if not unique_ids:
+            return {}
+
+        positions = {}
+        missing = []
+        for position_id, raw in zip(unique_ids, await self._redis.mget([position_key(i) for i in unique_ids])):
+            if raw is None:
+                missing.append(position_id)
+            else:
+                positions[position_id] = _load(raw)
+
+        if missing:
+            fetched = await self._inner.get_many_by_ids(missing)
+            if fetched:
+                pipe = self._redis.pipeline()
+                for position_id, position in fetched.items():
+                    pipe.setex(position_key(position_id), self._ttl, _dump(position))
+                await pipe.execute()
+            positions.update(fetched)
+        return positions
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Position]:
+        """Get all positions with pagination"""
+        return await self._inner.get_all(skip, limit)
+
+    async def get_by_name(self, name: str) -> Optional[Position]:
+        """Get position by name"""
+        return await self._inner.get_by_name(name)
+
+    async def create(self, position: Position) -> Position:
+        """Create a new position"""
+        return await self._inner.create(position)
+
+    async def create_if_unique(self, position: Position) -> Optional[Position]:
+        """Create a position, returning None if it violates a uniqueness constraint"""
+        return await self._inner.create_if_unique(position)
+
+    async def update(self, position: Position) -> Position:
+        """Update an existing position and drop its cache entry on commit"""
+        updated_position = await self._inner.update(position)
+        self._invalidate(position.id)
+        return updated_position
+
+    async def update_if_exists(self, position: Position) -> Optional[Position]:
+        """Update a position and drop its cache entry on commit"""
+        updated_position = await self._inner.update_if_exists(position)
+        if updated_position:
+            self._invalidate(position.id)
+        return updated_position
+
+    async def delete(self, position_id: uuid.UUID) -> bool:
+        """Delete a position and drop its cache entry on commit"""
+        deleted = await self._inner.delete(position_id)
+        if deleted:
+            self._invalidate(position_id)
+        return deleted
+
+    async def has_employees(self, position_id: uuid.UUID) -> bool:
+        """Check if position has any employees assigned"""
+        return await self._inner.has_employees(position_id)
+
+    def _invalidate(self, position_id: uuid.UUID) -> None:
+        """Drop the cached position once the write is committed"""
+        after_commit(self._session, lambda: self._redis.delete(position_key(position_id)))
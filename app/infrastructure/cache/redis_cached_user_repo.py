@@ -0,0 +1,131 @@
+"""
+Redis read-through cache for the user repository
+"""
+from datetime import datetime
+from typing import Optional
+import uuid
+
+import orjson
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import after_commit
+from app.domain.entities.employee import User
+from app.domain.interfaces.repositories import IUserRepository
+from app.infrastructure.cache.redis_client import CACHE_TTL_SECONDS
+
+
+def _key(username: str) -> str:
+    return f"user:{username}"
+
+
+def _id_key(user_id: uuid.UUID) -> str:
+    return f"user:id:{user_id}"
+
+
+def _dump(user: User) -> bytes:
+    # Profile fields only: the password hash never leaves the database
+    return orjson.dumps({
+        "id": user.id,
+        "created_at": user.created_at,
+        "updated_at": user.updated_at,
+        "username": user.username,
+        "email": user.email,
+        "is_active": user.is_active
+    })
+
+
+def _load(raw: bytes) -> User:
+    data = orjson.loads(raw)
+    return User.from_row(
+        id=uuid.UUID(data["id"]),
+        created_at=datetime.fromisoformat(data["created_at"]),
+        updated_at=datetime.fromisoformat(data["updated_at"]),
+        username=data["username"],
+        email=data["email"],
+        # Cached users carry no hash; login reads credentials through the uncached repository
+        password_hash="",
+        is_active=data["is_active"]
+    )
+
+
+class CachedUserRepository:
+    """Caches user profiles by ID and username in Redis; writes go to the wrapped repository (IUserRepository).
+
+    Cached users have an empty password_hash, so password checks must not use this repository.
+    Entries are dropped only after the session commits.
+    """
+
+    def __init__(self, inner: IUserRepository, redis, session: AsyncSession, ttl: int = CACHE_TTL_SECONDS):
+        self._inner = inner
+        self._redis = redis
+        self._session = session
+        self._ttl = ttl
+
+    async def get_by_id(self, user_id: uuid.UUID) -> Optional[User]:
+        """Get user by ID, from cache when possible"""
+        raw = await self._redis.get(_id_key(user_id))
+        if raw is not None:
+            return _load(raw)
+
+        user = await self._inner.get_by_id(user_id)
+        if user:
+            await self._store(user)
+        return user
+
+    async def get_by_username(self, username: str) -> Optional[User]:
+        """Get user by username, from cache when possible"""
+        raw = await self._redis.get(_key(username))
+        if raw is not None:
+            return _load(raw)
+
+        user = await self._inner.get_by_username(username)
+        if user:
+            await self._store(user)
+        return user
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Get user by email"""
+        return await self._inner.get_by_email(email)
+
+    async def create(self, user: User) -> User:
+        """Create a new user"""
+        return await self._inner.create(user)
+
+    async def create_if_unique(self, user: User) -> Optional[User]:
+        """Create a user, returning None if it violates a uniqueness constraint"""
+        return await self._inner.create_if_unique(user)
+
+    # Usernames never change, so the entity's username and ID are the keys to invalidate
+
+    async def update(self, user: User) -> User:
+        """Update an existing user and drop its cache entries on commit"""
+        updated_user = await self._inner.update(user)
+        self._invalidate(user.username, user.id)
+        return updated_user
+
+    async def update_if_exists(self, user: User) -> Optional[User]:
+        """Update a user and drop its cache entries on commit"""
+        updated_user = await self._inner.update_if_exists(user)
+        if updated_user:
+            self._invalidate(user.username, user.id)
+        return updated_user
+
+    async def delete(self, user_id: uuid.UUID) -> bool:
+        """Delete a user and drop its cache entries on commit"""
+        user = await self._inner.get_by_id(user_id)
+        deleted = await self._inner.delete(user_id)
+        if deleted and user:
+            self._invalidate(user.username, user_id)
+        return deleted
+
+    async def _store(self, user: User) -> None:
+        """Cache a user under both lookup keys in one round trip"""
+        raw = _dump(user)
+        pipe = self._redis.pipeline()
+        pipe.setex(_key(user.username), self._ttl, raw)
+        pipe.setex(_id_key(user.id), self._ttl, raw)
+        await pipe.execute()
+
+    def _invalidate(self, username: str, user_id: uuid.UUID) -> None:
+        """Drop both cache keys once the write is committed"""
+        after_commit(self._session, lambda: self._redis.delete(_key(username), _id_key(user_id)))
@@ -0,0 +1,25 @@
+"""
+Shared Redis client for repository caches
+"""
+import os
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+# Caching is disabled unless REDIS_URL is set
+REDIS_URL = os.getenv("REDIS_URL")
+CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "300"))
+
+_redis = None
+
+
+def get_redis() -> Optional["Redis"]:
+    """Return the shared async Redis client, or None when caching is disabled"""
+    global _redis
+    if REDIS_URL is None:
+        return None
+    if _redis is None:
+        from redis.asyncio import Redis
+        _redis = Redis.from_url(REDIS_URL)
+    return _redis
@@ -0,0 +1,55 @@
+"""
+Redis cache for serialized list endpoint pages
+"""
+from typing import Optional
+
+from app.infrastructure.cache.redis_client import CACHE_TTL_SECONDS, get_redis
+
+EMPLOYEE_LIST_NAMESPACE = "emp:list"
+POSITION_LIST_NAMESPACE = "pos:list"
+
+
+class ListCache:
+    """Caches rendered JSON pages per (skip, limit); a write drops every page in the namespace"""
+
+    def __init__(self, redis, namespace: str, ttl: int = CACHE_TTL_SECONDS):
+        self._redis = redis
+        self._namespace = namespace
+        self._ttl = ttl
+
+    def _key(self, skip: int, limit: int) -> str:
+        return f"{self._namespace}:{skip}:{limit}"
+
+    def _index_key(self) -> str:
+        # Set of cached page keys, so invalidation needs no KEYS/SCAN over the keyspace
+        return f"{self._namespace}:keys"
+
+    async def get(self, skip: int, limit: int) -> Optional[bytes]:
+        """Return the cached JSON body for a page, or None on a miss"""
+        return await self._redis.get(self._key(skip, limit))
+
+    async def set(self, skip: int, limit: int, body: bytes) -> None:
+        """Store the JSON body for a page"""
+        key = self._key(skip, limit)
+        pipe = self._redis.pipeline()
+        pipe.setex(key, self._ttl, body)
+        pipe.sadd(self._index_key(), key)
+        pipe.expire(self._index_key(), self._ttl)
+        await pipe.execute()
+
+    async def invalidate(self) -> None:
+        """Drop every cached page in the namespace"""
+        keys = await self._redis.smembers(self._index_key())
+        await self._redis.delete(self._index_key(), *keys)
+
+
+def get_employee_list_cache() -> Optional[ListCache]:
+    """Dependency to get the employee list cache, or None when caching is disabled"""
+    redis = get_redis()
+    return ListCache(redis, EMPLOYEE_LIST_NAMESPACE) if redis is not None else None
+
+
+def get_position_list_cache() -> Optional[ListCache]:
+    """Dependency to get the position list cache, or None when caching is disabled"""
+    redis = get_redis()
+    return ListCache(redis, POSITION_LIST_NAMESPACE) if redis is not None else None
@@ -1,54 +1,86 @@
 """
 Updated database models with UUID support for Clean Architecture
 """
-from sqlalchemy import Column, String, Boolean, ForeignKey, Text, DateTime
+from sqlalchemy import Column, String, Boolean, ForeignKey, Text, DateTime, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from sqlalchemy.types import TypeDecorator, CHAR
+from sqlalchemy.types import TypeDecorator, BINARY
 from sqlalchemy.dialects.postgresql import UUID
+from functools import lru_cache
 import uuid
 
 from app.database import Base
 
 
+# UUIDs are immutable, so repeated ids in result sets can share one object
+@lru_cache(maxsize=4096)
+def _uuid_from_bytes(raw: bytes) -> uuid.UUID:
+    return uuid.UUID(bytes=raw)
+
+
 class GUID(TypeDecorator):
     """Platform-independent GUID type.
-    Uses PostgreSQL's UUID type, otherwise uses CHAR(36), storing as stringified hex values.
+    Uses PostgreSQL's UUID type, otherwise uses BINARY(16), storing the raw UUID bytes.
     """
-    impl = CHAR
+    impl = BINARY
     cache_ok = True
 
     def load_dialect_impl(self, dialect):
         if dialect.name == 'postgresql':
-            return dialect.type_descriptor(UUID())
+            # as_uuid lets the driver bind/return uuid.UUID natively, without str round trips
+            return dialect.type_descriptor(UUID(as_uuid=True))
         else:
-            return dialect.type_descriptor(CHAR(36))
+            # 16 bytes instead of a 36-char string: narrower rows, indexes and key compares
+            return dialect.type_descriptor(BINARY(16))
 
     def process_bind_param(self, value, dialect):
         if value is None:
             return value
-        elif dialect.name == 'postgresql':
-            return str(value)
-        else:
-            if not isinstance(value, uuid.UUID):
-                return str(uuid.UUID(value))
-            else:
-                return str(value)
+        if isinstance(value, bytes):
+            value = uuid.UUID(bytes=value)
+        elif not isinstance(value, uuid.UUID):
+            value = uuid.UUID(value)
+        return value if dialect.name == 'postgresql' else value.bytes
 
     def process_result_value(self, value, dialect):
-        if value is None:
-            return value
-        else:
-            if not isinstance(value, uuid.UUID):
-                return uuid.UUID(value)
+        if value is None or isinstance(value, uuid.UUID):
             return value
+        if isinstance(value, str):
+            # Row written before ids were binary and not yet converted
+            return uuid.UUID(value)
+        return _uuid_from_bytes(value)
+
+
+def convert_legacy_guid_columns(connection) -> int:
+    """Rewrite GUID values stored as 36-char strings to the 16-byte form; returns rows changed.
+
+    Databases created before ids were binary keep text keys that binary lookups never match.
+    Safe to run repeatedly: only values SQLite still types as text are touched.
+    """
+    if connection.dialect.name != 'sqlite':
+        return 0
+    converted = 0
+    for table in Base.metadata.sorted_tables:
+        for column in table.columns:
+            if not isinstance(column.type, GUID):
+                continue
+            rows = connection.execute(text(
+                f"SELECT rowid, {column.name} FROM {table.name} WHERE typeof({column.name}) = 'text'"
+            )).all()
+            if rows:
+                connection.execute(
+                    text(f"UPDATE {table.name} SET {column.name} = :value WHERE rowid = :rowid"),
+                    [{"rowid": rowid, "value": uuid.UUID(value).bytes} for rowid, value in rows]
+                )
+                converted += len(rows)
+    return converted
 
 
 class UserModel(Base):
     """User database model with UUID"""
     __tablename__ = "users"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
     username = Column(String(50), unique=True, index=True, nullable=False)
     email = Column(String(100), unique=True, index=True, nullable=False)
     password_hash = Column(String(255), nullable=False)
@@ -61,7 +93,7 @@ class PositionModel(Base):
     """Position database model with UUID"""
     __tablename__ = "positions"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
     name = Column(String(100), nullable=False, unique=True)
     description = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -75,10 +107,11 @@ class EmployeeModel(Base):
     """Employee database model with UUID"""
     __tablename__ = "employees"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
     first_name = Column(String(50), nullable=False)
     last_name = Column(String(50), nullable=False)
-    position_id = Column(GUID(), ForeignKey("positions.id"), nullable=False)
+    # Indexed for get_by_position_id and the has_employees check
+    position_id = Column(GUID(), ForeignKey("positions.id"), nullable=False, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
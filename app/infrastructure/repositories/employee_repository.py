@@ -1,28 +1,47 @@
 """
 Employee repository implementation
 """
-from typing import List, Optional
+from typing import Dict, List, Optional
 import uuid
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from app.domain.entities.employee import Employee, Position
-from app.domain.interfaces.repositories import IEmployeeRepository
+from app.domain.exceptions import NotFoundError
 from app.infrastructure.database.models import EmployeeModel, PositionModel
 
 
-class EmployeeRepository(IEmployeeRepository):
-    """SQLAlchemy implementation of employee repository"""
+# Flat employee + position projection for list reads; only the columns the entities need
+_EMPLOYEE_WITH_POSITION = (
+    select(
+        EmployeeModel.id,
+        EmployeeModel.created_at,
+        EmployeeModel.updated_at,
+        EmployeeModel.first_name,
+        EmployeeModel.last_name,
+        EmployeeModel.position_id,
+        PositionModel.id,
+        PositionModel.created_at,
+        PositionModel.updated_at,
+        PositionModel.name,
+        PositionModel.description
+    )
+    .outerjoin(PositionModel, EmployeeModel.position_id == PositionModel.id)
+)
 
-    def __init__(self, db_session: Session):
+
+class EmployeeRepository:
+    """SQLAlchemy implementation of employee repository (IEmployeeRepository)"""
+
+    def __init__(self, db_session: AsyncSession):
         self._db = db_session
 
     async def get_by_id(self, employee_id: uuid.UUID) -> Optional[Employee]:
         """Get employee by ID"""
-        db_employee = (
-            self._db.query(EmployeeModel)
-            .options(joinedload(EmployeeModel.position))
-            .filter(EmployeeModel.id == employee_id)
-            .first()
+        # Session.get serves already-loaded rows from the identity map
+        db_employee = await self._db.get(
+            EmployeeModel, employee_id, options=[joinedload(EmployeeModel.position)]
         )
         if not db_employee:
             return None
@@ -30,24 +49,21 @@ class EmployeeRepository(IEmployeeRepository):
 
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[Employee]:
         """Get all employees with pagination"""
-        db_employees = (
-            self._db.query(EmployeeModel)
-            .options(joinedload(EmployeeModel.position))
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
-        return [self._to_domain_entity(emp) for emp in db_employees]
+        # Core rows skip ORM instance construction and identity-map bookkeeping
+        result = await self._db.execute(_EMPLOYEE_WITH_POSITION.offset(skip).limit(limit))
+        rows = result.all()
+        # Employees sharing a position share one Position instance
+        positions: Dict[uuid.UUID, Position] = {}
+        return [self._row_to_domain_entity(row, positions) for row in rows]
 
     async def get_by_position_id(self, position_id: uuid.UUID) -> List[Employee]:
         """Get all employees in a specific position"""
-        db_employees = (
-            self._db.query(EmployeeModel)
-            .options(joinedload(EmployeeModel.position))
-            .filter(EmployeeModel.position_id == position_id)
-            .all()
+        # Same column projection as get_all; every row shares the one position
+        result = await self._db.execute(
+            _EMPLOYEE_WITH_POSITION.where(EmployeeModel.position_id == position_id)
         )
-        return [self._to_domain_entity(emp) for emp in db_employees]
+        positions: Dict[uuid.UUID, Position] = {}
+        return [self._row_to_domain_entity(row, positions) for row in result.all()]
 
     async def create(self, employee: Employee) -> Employee:
         """Create a new employee"""
@@ -60,64 +76,116 @@ class EmployeeRepository(IEmployeeRepository):
             updated_at=employee.updated_at
         )
         self._db.add(db_employee)
-        self._db.commit()
-        self._db.refresh(db_employee)
-        
-        # Load the position relationship
-        db_employee = (
-            self._db.query(EmployeeModel)
-            .options(joinedload(EmployeeModel.position))
-            .filter(EmployeeModel.id == db_employee.id)
-            .first()
+        await self._db.flush()
+        return await self._to_saved_entity(db_employee, employee)
+
+    async def bulk_create(self, employees: List[Employee]) -> List[Employee]:
+        """Create many employees with one executemany INSERT"""
+        if not employees:
+            return []
+        await self._db.execute(
+            insert(EmployeeModel),
+            [
+                {
+                    "id": emp.id,
+                    "first_name": emp.first_name,
+                    "last_name": emp.last_name,
+                    "position_id": emp.position_id,
+                    "created_at": emp.created_at,
+                    "updated_at": emp.updated_at
+                }
+                for emp in employees
+            ]
         )
-        return self._to_domain_entity(db_employee)
+        # Every column was supplied by the caller, so there is nothing to read back
+        return employees
 
     async def update(self, employee: Employee) -> Employee:
-        """Update an existing employee"""
-        db_employee = (
-            self._db.query(EmployeeModel)
-            .filter(EmployeeModel.id == employee.id)
-            .first()
+        """Update an existing employee with a single UPDATE ... RETURNING"""
+        updated_employee = await self.update_if_exists(employee)
+        if updated_employee is None:
+            raise NotFoundError(f"Employee with ID {employee.id} not found")
+        return updated_employee
+
+    async def update_if_exists(self, employee: Employee) -> Optional[Employee]:
+        """Update an employee in one round trip, returning None if it does not exist"""
+        result = await self._db.execute(
+            update(EmployeeModel)
+            .where(EmployeeModel.id == employee.id)
+            .values(
+                first_name=employee.first_name,
+                last_name=employee.last_name,
+                position_id=employee.position_id,
+                updated_at=employee.updated_at
+            )
+            .returning(EmployeeModel)
         )
+        db_employee = result.scalar_one_or_none()
         if not db_employee:
-            raise ValueError(f"Employee with ID {employee.id} not found")
-
-        db_employee.first_name = employee.first_name
-        db_employee.last_name = employee.last_name
-        db_employee.position_id = employee.position_id
-        db_employee.updated_at = employee.updated_at
-
-        self._db.commit()
-        self._db.refresh(db_employee)
-        
-        # Load the position relationship
-        db_employee = (
-            self._db.query(EmployeeModel)
-            .options(joinedload(EmployeeModel.position))
-            .filter(EmployeeModel.id == db_employee.id)
-            .first()
+            return None
+
+        return Employee.from_row(
+            id=db_employee.id,
+            created_at=db_employee.created_at,
+            updated_at=db_employee.updated_at,
+            first_name=db_employee.first_name,
+            last_name=db_employee.last_name,
+            position_id=db_employee.position_id,
+            position=self._known_position(employee)
         )
-        return self._to_domain_entity(db_employee)
 
     async def delete(self, employee_id: uuid.UUID) -> bool:
-        """Delete an employee"""
-        db_employee = (
-            self._db.query(EmployeeModel)
-            .filter(EmployeeModel.id == employee_id)
-            .first()
+        """Delete an employee with a single DELETE statement"""
+        result = await self._db.execute(delete(EmployeeModel).where(EmployeeModel.id == employee_id))
+        return result.rowcount > 0
+
+    @staticmethod
+    def _row_to_domain_entity(row, positions: Dict[uuid.UUID, Position]) -> Employee:
+        """Convert an _EMPLOYEE_WITH_POSITION row to a domain entity, reusing converted positions"""
+        (emp_id, emp_created_at, emp_updated_at, first_name, last_name, position_id,
+         pos_id, pos_created_at, pos_updated_at, name, description) = row
+        position = None
+        if pos_id is not None:
+            position = positions.get(pos_id)
+            if position is None:
+                position = positions[pos_id] = Position.from_row(
+                    id=pos_id,
+                    created_at=pos_created_at,
+                    updated_at=pos_updated_at,
+                    name=name,
+                    description=description
+                )
+        return Employee.from_row(
+            id=emp_id,
+            created_at=emp_created_at,
+            updated_at=emp_updated_at,
+            first_name=first_name,
+            last_name=last_name,
+            position_id=position_id,
+            position=position
         )
-        if not db_employee:
-            return False
 
-        self._db.delete(db_employee)
-        self._db.commit()
-        return True
+    @staticmethod
+    def _known_position(employee: Employee) -> Optional[Position]:
+        """Position already loaded by the caller, if it matches the employee's position_id"""
+        if employee.position is not None and employee.position.id == employee.position_id:
+            return employee.position
+        return None
 
-    def _to_domain_entity(self, db_employee: EmployeeModel) -> Employee:
-        """Convert database model to domain entity"""
-        position = None
-        if db_employee.position:
-            position = Position(
+    async def _to_saved_entity(self, db_employee: EmployeeModel, employee: Employee) -> Employee:
+        """Convert a just-written model, loading its position only if the caller had none"""
+        position = self._known_position(employee)
+        if position is None:
+            # Lazy loads cannot run under AsyncSession, so fetch the relationship explicitly
+            await self._db.refresh(db_employee, ["position"])
+        return self._to_domain_entity(db_employee, position)
+
+    def _to_domain_entity(
+        self, db_employee: EmployeeModel, position: Optional[Position] = None
+    ) -> Employee:
+        """Convert database model to domain entity, reusing an already-loaded position"""
+        if position is None and db_employee.position:
+            position = Position.from_row(
                 id=db_employee.position.id,
                 created_at=db_employee.position.created_at,
                 updated_at=db_employee.position.updated_at,
@@ -125,7 +193,7 @@ class EmployeeRepository(IEmployeeRepository):
                 description=db_employee.position.description
             )
 
-        return Employee(
+        return Employee.from_row(
             id=db_employee.id,
             created_at=db_employee.created_at,
             updated_at=db_employee.updated_at,
@@ -1,49 +1,63 @@
 """
 Position repository implementation
 """
-from typing import List, Optional
+from typing import Dict, List, Optional
 import uuid
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, exists, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.employee import Position
-from app.domain.interfaces.repositories import IPositionRepository
+from app.domain.exceptions import NotFoundError
 from app.infrastructure.database.models import PositionModel, EmployeeModel
 
 
-class PositionRepository(IPositionRepository):
-    """SQLAlchemy implementation of position repository"""
+# Column projection for list reads, ordered like Position.from_row's parameters
+_POSITION_COLUMNS = select(
+    PositionModel.id,
+    PositionModel.created_at,
+    PositionModel.updated_at,
+    PositionModel.name,
+    PositionModel.description
+)
 
-    def __init__(self, db_session: Session):
+
+class PositionRepository:
+    """SQLAlchemy implementation of position repository (IPositionRepository)"""
+
+    def __init__(self, db_session: AsyncSession):
         self._db = db_session
 
     async def get_by_id(self, position_id: uuid.UUID) -> Optional[Position]:
         """Get position by ID"""
-        db_position = (
-            self._db.query(PositionModel)
-            .filter(PositionModel.id == position_id)
-            .first()
-        )
+        # Session.get serves already-loaded rows from the identity map
+        db_position = await self._db.get(PositionModel, position_id)
         if not db_position:
             return None
         return self._to_domain_entity(db_position)
 
+    async def get_many_by_ids(self, position_ids: List[uuid.UUID]) -> Dict[uuid.UUID, Position]:
+        """Get positions keyed by ID with a single IN query"""
+        if not position_ids:
+            return {}
+        result = await self._db.execute(
+            select(PositionModel).where(PositionModel.id.in_(set(position_ids)))
+        )
+        db_positions = result.scalars().all()
+        return {pos.id: self._to_domain_entity(pos) for pos in db_positions}
+
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[Position]:
         """Get all positions with pagination"""
-        db_positions = (
-            self._db.query(PositionModel)
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
-        return [self._to_domain_entity(pos) for pos in db_positions]
+        # Core rows skip ORM instance construction and identity-map bookkeeping
+        result = await self._db.execute(_POSITION_COLUMNS.offset(skip).limit(limit))
+        return [Position.from_row(*row) for row in result.all()]
 
     async def get_by_name(self, name: str) -> Optional[Position]:
         """Get position by name"""
-        db_position = (
-            self._db.query(PositionModel)
-            .filter(PositionModel.name == name)
-            .first()
+        result = await self._db.execute(
+            select(PositionModel).where(PositionModel.name == name).limit(1)
         )
+        db_position = result.scalars().first()
         if not db_position:
             return None
         return self._to_domain_entity(db_position)
@@ -58,54 +72,67 @@ class PositionRepository(IPositionRepository):
             updated_at=position.updated_at
         )
         self._db.add(db_position)
-        self._db.commit()
-        self._db.refresh(db_position)
+        await self._db.flush()
+        return self._to_domain_entity(db_position)
+
+    async def create_if_unique(self, position: Position) -> Optional[Position]:
+        """Create a position, returning None if it violates a uniqueness constraint"""
+        db_position = PositionModel(
+            id=position.id,
+            name=position.name,
+            description=position.description,
+            created_at=position.created_at,
+            updated_at=position.updated_at
+        )
+        try:
+            # The savepoint undoes only this INSERT, keeping the request's transaction usable
+            async with self._db.begin_nested():
+                self._db.add(db_position)
+        except IntegrityError:
+            return None
         return self._to_domain_entity(db_position)
 
     async def update(self, position: Position) -> Position:
-        """Update an existing position"""
-        db_position = (
-            self._db.query(PositionModel)
-            .filter(PositionModel.id == position.id)
-            .first()
+        """Update an existing position with a single UPDATE ... RETURNING"""
+        updated_position = await self.update_if_exists(position)
+        if updated_position is None:
+            raise NotFoundError(f"Position with ID {position.id} not found")
+        return updated_position
+
+    async def update_if_exists(self, position: Position) -> Optional[Position]:
+        """Update a position in one round trip, returning None if it does not exist"""
+        result = await self._db.execute(
+            update(PositionModel)
+            .where(PositionModel.id == position.id)
+            .values(
+                name=position.name,
+                description=position.description,
+                updated_at=position.updated_at
+            )
+            .returning(PositionModel)
         )
+        db_position = result.scalar_one_or_none()
         if not db_position:
-            raise ValueError(f"Position with ID {position.id} not found")
-
-        db_position.name = position.name
-        db_position.description = position.description
-        db_position.updated_at = position.updated_at
+            return None
 
-        self._db.commit()
-        self._db.refresh(db_position)
         return self._to_domain_entity(db_position)
 
     async def delete(self, position_id: uuid.UUID) -> bool:
-        """Delete a position"""
-        db_position = (
-            self._db.query(PositionModel)
-            .filter(PositionModel.id == position_id)
-            .first()
-        )
-        if not db_position:
-            return False
-
-        self._db.delete(db_position)
-        self._db.commit()
-        return True
+        """Delete a position with a single DELETE statement"""
+        result = await self._db.execute(delete(PositionModel).where(PositionModel.id == position_id))
+        return result.rowcount > 0
 
     async def has_employees(self, position_id: uuid.UUID) -> bool:
         """Check if position has any employees assigned"""
-        employee_count = (
-            self._db.query(EmployeeModel)
-            .filter(EmployeeModel.position_id == position_id)
-            .count()
+        # EXISTS stops at the first matching index entry instead of counting them all
+        result = await self._db.execute(
+            select(exists().where(EmployeeModel.position_id == position_id))
         )
-        return employee_count > 0
+        return result.scalar_one()
 
     def _to_domain_entity(self, db_position: PositionModel) -> Position:
         """Convert database model to domain entity"""
-        return Position(
+        return Position.from_row(
             id=db_position.id,
             created_at=db_position.created_at,
             updated_at=db_position.updated_at,
@@ -1,53 +1,62 @@
 """
 User repository implementation
 """
-from typing import Optional
+from typing import Dict, Optional, Tuple
 import uuid
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.employee import User
-from app.domain.interfaces.repositories import IUserRepository
+from app.domain.exceptions import NotFoundError
 from app.infrastructure.database.models import UserModel
 
 
-class UserRepository(IUserRepository):
-    """SQLAlchemy implementation of user repository"""
+class UserRepository:
+    """SQLAlchemy implementation of user repository (IUserRepository)"""
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: AsyncSession):
         self._db = db_session
+        # Users seen by this instance, keyed by ("id" | "username" | "email", value);
+        # repositories are built per request, so this never outlives one request
+        self._identity: Dict[Tuple[str, object], User] = {}
 
     async def get_by_id(self, user_id: uuid.UUID) -> Optional[User]:
         """Get user by ID"""
-        db_user = (
-            self._db.query(UserModel)
-            .filter(UserModel.id == user_id)
-            .first()
-        )
+        cached = self._identity.get(("id", user_id))
+        if cached is not None:
+            return cached
+        # Session.get serves already-loaded rows from the identity map
+        db_user = await self._db.get(UserModel, user_id)
         if not db_user:
             return None
-        return self._to_domain_entity(db_user)
+        return self._remember(self._to_domain_entity(db_user))
 
     async def get_by_username(self, username: str) -> Optional[User]:
         """Get user by username"""
-        db_user = (
-            self._db.query(UserModel)
-            .filter(UserModel.username == username)
-            .first()
+        cached = self._identity.get(("username", username))
+        if cached is not None:
+            return cached
+        result = await self._db.execute(
+            select(UserModel).where(UserModel.username == username).limit(1)
         )
+        db_user = result.scalars().first()
         if not db_user:
             return None
-        return self._to_domain_entity(db_user)
+        return self._remember(self._to_domain_entity(db_user))
 
     async def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
-        db_user = (
-            self._db.query(UserModel)
-            .filter(UserModel.email == email)
-            .first()
+        cached = self._identity.get(("email", email))
+        if cached is not None:
+            return cached
+        result = await self._db.execute(
+            select(UserModel).where(UserModel.email == email).limit(1)
         )
+        db_user = result.scalars().first()
         if not db_user:
             return None
-        return self._to_domain_entity(db_user)
+        return self._remember(self._to_domain_entity(db_user))
 
     async def create(self, user: User) -> User:
         """Create a new user"""
@@ -61,47 +70,78 @@ class UserRepository(IUserRepository):
             updated_at=user.updated_at
         )
         self._db.add(db_user)
-        self._db.commit()
-        self._db.refresh(db_user)
-        return self._to_domain_entity(db_user)
+        await self._db.flush()
+        return self._remember(self._to_domain_entity(db_user))
+
+    async def create_if_unique(self, user: User) -> Optional[User]:
+        """Create a user, returning None if it violates a uniqueness constraint"""
+        db_user = UserModel(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            password_hash=user.password_hash,
+            is_active=user.is_active,
+            created_at=user.created_at,
+            updated_at=user.updated_at
+        )
+        try:
+            # The savepoint undoes only this INSERT, keeping the request's transaction usable
+            async with self._db.begin_nested():
+                self._db.add(db_user)
+        except IntegrityError:
+            return None
+        return self._remember(self._to_domain_entity(db_user))
 
     async def update(self, user: User) -> User:
-        """Update an existing user"""
-        db_user = (
-            self._db.query(UserModel)
-            .filter(UserModel.id == user.id)
-            .first()
+        """Update an existing user with a single UPDATE ... RETURNING"""
+        updated_user = await self.update_if_exists(user)
+        if updated_user is None:
+            raise NotFoundError(f"User with ID {user.id} not found")
+        return updated_user
+
+    async def update_if_exists(self, user: User) -> Optional[User]:
+        """Update a user in one round trip, returning None if it does not exist"""
+        result = await self._db.execute(
+            update(UserModel)
+            .where(UserModel.id == user.id)
+            .values(
+                username=user.username,
+                email=user.email,
+                password_hash=user.password_hash,
+                is_active=user.is_active,
+                updated_at=user.updated_at
+            )
+            .returning(UserModel)
         )
+        db_user = result.scalar_one_or_none()
         if not db_user:
-            raise ValueError(f"User with ID {user.id} not found")
-
-        db_user.username = user.username
-        db_user.email = user.email
-        db_user.password_hash = user.password_hash
-        db_user.is_active = user.is_active
-        db_user.updated_at = user.updated_at
+            self._forget(user.id)
+            return None
 
-        self._db.commit()
-        self._db.refresh(db_user)
-        return self._to_domain_entity(db_user)
+        return self._remember(self._to_domain_entity(db_user))
 
     async def delete(self, user_id: uuid.UUID) -> bool:
-        """Delete a user"""
-        db_user = (
-            self._db.query(UserModel)
-            .filter(UserModel.id == user_id)
-            .first()
-        )
-        if not db_user:
-            return False
+        """Delete a user with a single DELETE statement"""
+        result = await self._db.execute(delete(UserModel).where(UserModel.id == user_id))
+        self._forget(user_id)
+        return result.rowcount > 0
+
+    def _remember(self, user: User) -> User:
+        """Index a loaded or written user under all of its lookup keys"""
+        self._forget(user.id)
+        self._identity[("id", user.id)] = user
+        self._identity[("username", user.username)] = user
+        self._identity[("email", user.email)] = user
+        return user
 
-        self._db.delete(db_user)
-        self._db.commit()
-        return True
+    def _forget(self, user_id: uuid.UUID) -> None:
+        """Drop every entry for a user, including keys for a username/email it no longer has"""
+        for key in [key for key, user in self._identity.items() if user.id == user_id]:
+            del self._identity[key]
 
     def _to_domain_entity(self, db_user: UserModel) -> User:
         """Convert database model to domain entity"""
-        return User(
+        return User.from_row(
             id=db_user.id,
             created_at=db_user.created_at,
             updated_at=db_user.updated_at,
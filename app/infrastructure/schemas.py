@@ -1,7 +1,7 @@
 """
 Updated Pydantic schemas with UUID support for Clean Architecture
 """
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, model_validator
 from typing import Optional
 import uuid
 from datetime import datetime
@@ -13,8 +13,7 @@ class BaseResponseSchema(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # User schemas
@@ -82,7 +81,11 @@ class EmployeeUpdate(EmployeeBase):
 
 class EmployeeResponse(BaseResponseSchema, EmployeeBase):
     position: Optional[PositionResponse] = None
-    
-    @property
-    def full_name(self) -> str:
-        return f"{self.first_name} {self.last_name}"
\ No newline at end of file
+    # Domain employees carry a precomputed full_name; other sources get it filled in once
+    full_name: Optional[str] = None
+
+    @model_validator(mode="after")
+    def _fill_full_name(self) -> "EmployeeResponse":
+        if self.full_name is None:
+            self.full_name = f"{self.first_name} {self.last_name}"
+        return self
\ No newline at end of file
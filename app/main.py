@@ -1,7 +1,12 @@
 """
 Main FastAPI application for Employee Management API
 """
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer
 from sqlalchemy.orm import Session
 import uvicorn
@@ -11,15 +16,32 @@ from app.auth import router as auth_router
 from app.employees import router as employees_router
 from app.positions import router as positions_router
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+# Create tables on startup in development; disable where migrations own the schema
+AUTO_CREATE_TABLES = os.getenv("AUTO_CREATE_TABLES", "true").lower() in ("1", "true", "yes")
+
+# Worker processes when run as a script; each imports the app and opens its own DB pool
+# and bcrypt thread pool, so raise this together with BCRYPT_THREADS (see app/auth.py)
+UVICORN_WORKERS = int(os.getenv("UVICORN_WORKERS", "1"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run startup tasks once, off the event loop"""
+    if AUTO_CREATE_TABLES:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, lambda: Base.metadata.create_all(bind=engine))
+    yield
+
 
 app = FastAPI(
     title="Employee Management API",
     description="A CRUD API for employee management with JWT authentication",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan,
+    # orjson serializes UUIDs and datetimes natively and much faster than json.dumps
+    default_response_class=ORJSONResponse
 )
 
 security = HTTPBearer()
@@ -48,4 +70,16 @@ async def health_check():
 
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    if AUTO_CREATE_TABLES:
+        # Create the schema once here instead of racing DDL in every worker's lifespan
+        Base.metadata.create_all(bind=engine)
+        os.environ["AUTO_CREATE_TABLES"] = "false"
+    # "auto" uses uvloop and httptools when installed; workers need the import string
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="auto",
+        workers=UVICORN_WORKERS
+    )
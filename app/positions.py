@@ -1,12 +1,19 @@
 """
 Position management endpoints
 """
-from typing import List
+from typing import List, Optional
+import uuid
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse, Response
+from sqlalchemy import delete, exists, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
-from app.models import Position, User
+from app.database import get_async_db
+from app.infrastructure.cache.redis_cached_position_repo import invalidate_cached_position
+from app.infrastructure.cache.redis_list_cache import (
+    ListCache, get_employee_list_cache, get_position_list_cache
+)
+from app.models import Employee, Position, User
 from app.schemas import PositionCreate, PositionUpdate, PositionResponse
 from app.auth import get_current_active_user
 
@@ -17,7 +24,8 @@ router = APIRouter()
 async def get_positions(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
+    list_cache: Optional[ListCache] = Depends(get_position_list_cache),
     current_user: User = Depends(get_current_active_user)
 ):
     """
@@ -26,14 +34,33 @@ async def get_positions(
     - **skip**: Number of records to skip (default: 0)
     - **limit**: Maximum number of records to return (default: 100)
     """
-    positions = db.query(Position).offset(skip).limit(limit).all()
-    return positions
+    if list_cache is not None:
+        body = await list_cache.get(skip, limit)
+        if body is not None:
+            return Response(body, media_type="application/json")
+
+    # Stored rows are trusted: serialize them directly; response_model only documents the shape
+    result = await db.execute(
+        select(
+            Position.id,
+            Position.name,
+            Position.description,
+            Position.created_at,
+            Position.updated_at
+        )
+        .offset(skip)
+        .limit(limit)
+    )
+    response = ORJSONResponse([dict(row._mapping) for row in result.all()])
+    if list_cache is not None:
+        await list_cache.set(skip, limit, response.body)
+    return response
 
 
 @router.get("/{position_id}", response_model=PositionResponse, summary="Get position by ID")
 async def get_position(
-    position_id: int,
-    db: Session = Depends(get_db),
+    position_id: uuid.UUID,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """
@@ -41,7 +68,7 @@ async def get_position(
     
     - **position_id**: The ID of the position to retrieve
     """
-    position = db.query(Position).filter(Position.position_id == position_id).first()
+    position = await db.get(Position, position_id)
     if position is None:
         raise HTTPException(status_code=404, detail="Position not found")
     return position
@@ -50,13 +77,14 @@ async def get_position(
 @router.post("/", response_model=PositionResponse, summary="Create a new position")
 async def create_position(
     position: PositionCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
+    list_cache: Optional[ListCache] = Depends(get_position_list_cache),
     current_user: User = Depends(get_current_active_user)
 ):
     """
     Create a new position.
     
-    - **position_name**: Name of the position
+    - **name**: Name of the position
     - **description**: Optional description of the position
     """
     db_position = Position(
@@ -64,41 +92,51 @@ async def create_position(
         description=position.description
     )
     db.add(db_position)
-    db.commit()
-    db.refresh(db_position)
+    await db.commit()
+    if list_cache is not None:
+        await list_cache.invalidate()
+    await db.refresh(db_position)
     return db_position
 
 
 @router.put("/{position_id}", response_model=PositionResponse, summary="Update a position")
 async def update_position(
-    position_id: int,
+    position_id: uuid.UUID,
     position: PositionUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
+    list_cache: Optional[ListCache] = Depends(get_position_list_cache),
+    employee_list_cache: Optional[ListCache] = Depends(get_employee_list_cache),
     current_user: User = Depends(get_current_active_user)
 ):
     """
     Update an existing position.
     
     - **position_id**: The ID of the position to update
-    - **position_name**: Name of the position
+    - **name**: Name of the position
     - **description**: Optional description of the position
     """
-    db_position = db.query(Position).filter(Position.position_id == position_id).first()
-    if db_position is None:
+    result = await db.execute(
+        update(Position)
+        .where(Position.id == position_id)
+        .values(name=position.name, description=position.description)
+    )
+    await db.commit()
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Position not found")
-    
-    db_position.position_name = position.position_name
-    db_position.description = position.description
-    
-    db.commit()
-    db.refresh(db_position)
-    return db_position
+    await invalidate_cached_position(position_id)
+    if list_cache is not None:
+        await list_cache.invalidate()
+    # Employee pages embed the position
+    if employee_list_cache is not None:
+        await employee_list_cache.invalidate()
+    return await db.get(Position, position_id)
 
 
 @router.delete("/{position_id}", summary="Delete a position")
 async def delete_position(
-    position_id: int,
-    db: Session = Depends(get_db),
+    position_id: uuid.UUID,
+    db: AsyncSession = Depends(get_async_db),
+    list_cache: Optional[ListCache] = Depends(get_position_list_cache),
     current_user: User = Depends(get_current_active_user)
 ):
     """
@@ -106,19 +144,21 @@ async def delete_position(
     
     - **position_id**: The ID of the position to delete
     """
-    db_position = db.query(Position).filter(Position.position_id == position_id).first()
-    if db_position is None:
-        raise HTTPException(status_code=404, detail="Position not found")
-    
     # Check if any employees are assigned to this position
-    from app.models import Employee
-    employees_with_position = db.query(Employee).filter(Employee.position_id == position_id).first()
+    employees_with_position = await db.scalar(
+        select(exists().where(Employee.position_id == position_id))
+    )
     if employees_with_position:
         raise HTTPException(
             status_code=400, 
             detail="Cannot delete position: employees are assigned to this position"
         )
     
-    db.delete(db_position)
-    db.commit()
+    result = await db.execute(delete(Position).where(Position.id == position_id))
+    await db.commit()
+    if result.rowcount == 0:
+        raise HTTPException(status_code=404, detail="Position not found")
+    await invalidate_cached_position(position_id)
+    if list_cache is not None:
+        await list_cache.invalidate()
     return {"message": "Position deleted successfully"}
\ No newline at end of file
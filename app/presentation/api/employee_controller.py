@@ -4,24 +4,53 @@ Employee API endpoints using Clean Architecture
 from typing import List
 import uuid
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 
 from app.application.use_cases.employee_use_cases import EmployeeUseCases
+from app.domain.entities.employee import Employee
+from app.domain.exceptions import NotFoundError
 from app.infrastructure.schemas import EmployeeCreate, EmployeeUpdate, EmployeeResponse
 from app.infrastructure.repositories.employee_repository import EmployeeRepository
 from app.infrastructure.repositories.position_repository import PositionRepository
-from app.database import get_db
+from app.infrastructure.cache.redis_cached_position_repo import CachedPositionRepository
+from app.infrastructure.cache.redis_client import get_redis
+from app.database import get_async_db
 from app.auth import get_current_active_user
 from app.models import User
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 router = APIRouter()
 
 
-def get_employee_use_cases(db: Session = Depends(get_db)) -> EmployeeUseCases:
+def _employee_to_dict(employee: Employee) -> dict:
+    """Shape a domain employee like EmployeeResponse without running its validators"""
+    position = employee.position
+    return {
+        "id": employee.id,
+        "created_at": employee.created_at,
+        "updated_at": employee.updated_at,
+        "first_name": employee.first_name,
+        "last_name": employee.last_name,
+        "position_id": employee.position_id,
+        "position": None if position is None else {
+            "id": position.id,
+            "created_at": position.created_at,
+            "updated_at": position.updated_at,
+            "name": position.name,
+            "description": position.description
+        },
+        "full_name": employee.full_name
+    }
+
+
+def get_employee_use_cases(db: AsyncSession = Depends(get_async_db)) -> EmployeeUseCases:
     """Dependency to get employee use cases"""
     employee_repo = EmployeeRepository(db)
     position_repo = PositionRepository(db)
+    redis = get_redis()
+    if redis is not None:
+        position_repo = CachedPositionRepository(position_repo, redis, db)
     return EmployeeUseCases(employee_repo, position_repo)
 
 
@@ -40,7 +69,8 @@ async def get_employees(
     """
     try:
         employees = await employee_use_cases.get_all_employees(skip, limit)
-        return [_to_response_schema(emp) for emp in employees]
+        # Entities are already validated; response_model only documents the shape
+        return ORJSONResponse([_employee_to_dict(emp) for emp in employees])
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -60,7 +90,7 @@ async def get_employee(
         employee = await employee_use_cases.get_employee_by_id(employee_id)
         if not employee:
             raise HTTPException(status_code=404, detail="Employee not found")
-        return _to_response_schema(employee)
+        return EmployeeResponse.model_validate(employee)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -71,7 +101,8 @@ async def get_employee(
 async def create_employee(
     employee_data: EmployeeCreate,
     employee_use_cases: EmployeeUseCases = Depends(get_employee_use_cases),
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create a new employee.
@@ -86,12 +117,12 @@ async def create_employee(
             last_name=employee_data.last_name,
             position_id=employee_data.position_id
         )
-        return _to_response_schema(employee)
+        await db.commit()
+        return EmployeeResponse.model_validate(employee)
+    except NotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     except ValueError as e:
-        if "not found" in str(e):
-            raise HTTPException(status_code=404, detail=str(e))
-        else:
-            raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -101,7 +132,8 @@ async def update_employee(
     employee_id: uuid.UUID,
     employee_data: EmployeeUpdate,
     employee_use_cases: EmployeeUseCases = Depends(get_employee_use_cases),
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update an existing employee.
@@ -118,12 +150,12 @@ async def update_employee(
             last_name=employee_data.last_name,
             position_id=employee_data.position_id
         )
-        return _to_response_schema(employee)
+        await db.commit()
+        return EmployeeResponse.model_validate(employee)
+    except NotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     except ValueError as e:
-        if "not found" in str(e):
-            raise HTTPException(status_code=404, detail=str(e))
-        else:
-            raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -132,7 +164,8 @@ async def update_employee(
 async def delete_employee(
     employee_id: uuid.UUID,
     employee_use_cases: EmployeeUseCases = Depends(get_employee_use_cases),
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete an employee by their ID.
@@ -143,31 +176,9 @@ async def delete_employee(
         success = await employee_use_cases.delete_employee(employee_id)
         if not success:
             raise HTTPException(status_code=404, detail="Employee not found")
+        await db.commit()
         return {"message": "Employee deleted successfully"}
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-
-
-def _to_response_schema(employee) -> EmployeeResponse:
-    """Convert domain entity to response schema"""
-    position_response = None
-    if employee.position:
-        position_response = {
-            "id": employee.position.id,
-            "created_at": employee.position.created_at,
-            "updated_at": employee.position.updated_at,
-            "name": employee.position.name,
-            "description": employee.position.description
-        }
-    
-    return EmployeeResponse(
-        id=employee.id,
-        created_at=employee.created_at,
-        updated_at=employee.updated_at,
-        first_name=employee.first_name,
-        last_name=employee.last_name,
-        position_id=employee.position_id,
-        position=position_response
-    )
\ No newline at end of file
@@ -1,22 +1,27 @@
 """
 Database initialization script with sample data
 """
+import json
 import os
 import sys
+import uuid
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+SEED_USERS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts", "seed_users.json")
+
 try:
+    from sqlalchemy import exists, insert, select
     from sqlalchemy.orm import Session
     from app.database import SessionLocal, engine, Base
     from app.models import User, Position, Employee
-    from app.auth import get_password_hash
+    from app.infrastructure.database.models import convert_legacy_guid_columns
 except ImportError as e:
     print("Error: Missing required dependencies!")
     print(f"Import error: {e}")
     print("\nPlease install the required dependencies by running:")
     print("pip install -r requirements.txt")
     print("\nOr install individual packages:")
-    print("pip install fastapi uvicorn sqlalchemy python-jose[cryptography] passlib[bcrypt] python-multipart")
+    print("pip install fastapi uvicorn sqlalchemy PyJWT bcrypt python-multipart")
     sys.exit(1)
 
 
@@ -25,86 +30,83 @@ def init_db():
     print("Creating database tables...")
     Base.metadata.create_all(bind=engine)
     
+    # One-off for databases created with string ids; a no-op once every id is binary
+    with engine.begin() as connection:
+        converted = convert_legacy_guid_columns(connection)
+    if converted:
+        print(f"Converted {converted} string id values to binary.")
+    
     db: Session = SessionLocal()
     
     try:
-        # Check if data already exists
-        if db.query(User).first():
+        # Check if data already exists; EXISTS stops at the first row without loading a User
+        if db.scalar(select(exists().select_from(User))):
             print("Database already initialized with data.")
             return
         
         print("Adding sample data...")
         
-        # Create sample users
-        sample_users = [
-            User(
-                username="admin",
-                email="admin@company.com",
-                password_hash=get_password_hash("admin123"),
-                is_active=True
-            ),
-            User(
-                username="manager",
-                email="manager@company.com",
-                password_hash=get_password_hash("manager123"),
-                is_active=True
-            )
-        ]
+        # Ids are generated here so employees can reference positions without a round trip;
+        # each table is then written with one executemany INSERT and committed once
+        position_ids = {
+            name: uuid.uuid4()
+            for name in ("Software Engineer", "Product Manager", "Data Scientist", "DevOps Engineer")
+        }
         
-        for user in sample_users:
-            db.add(user)
+        # Create sample users; their bcrypt hashes are precomputed so seeding skips bcrypt
+        with open(SEED_USERS_PATH, encoding="utf-8") as f:
+            sample_users = json.load(f)
+        db.execute(insert(User), sample_users)
         
         # Create sample positions
         sample_positions = [
-            Position(
-                name="Software Engineer",
-                description="Develops and maintains software applications"
-            ),
-            Position(
-                name="Product Manager",
-                description="Manages product development and strategy"
-            ),
-            Position(
-                name="Data Scientist",
-                description="Analyzes data and builds predictive models"
-            ),
-            Position(
-                name="DevOps Engineer",
-                description="Manages infrastructure and deployment pipelines"
-            )
+            {
+                "id": position_ids["Software Engineer"],
+                "name": "Software Engineer",
+                "description": "Develops and maintains software applications"
+            },
+            {
+                "id": position_ids["Product Manager"],
+                "name": "Product Manager",
+                "description": "Manages product development and strategy"
+            },
+            {
+                "id": position_ids["Data Scientist"],
+                "name": "Data Scientist",
+                "description": "Analyzes data and builds predictive models"
+            },
+            {
+                "id": position_ids["DevOps Engineer"],
+                "name": "DevOps Engineer",
+                "description": "Manages infrastructure and deployment pipelines"
+            }
         ]
-        
-        for position in sample_positions:
-            db.add(position)
-        
-        db.commit()
+        db.execute(insert(Position), sample_positions)
         
         # Create sample employees
         sample_employees = [
-            Employee(
-                first_name="John",
-                last_name="Doe",
-                position_id=1
-            ),
-            Employee(
-                first_name="Jane",
-                last_name="Smith",
-                position_id=2
-            ),
-            Employee(
-                first_name="Mike",
-                last_name="Johnson",
-                position_id=1
-            ),
-            Employee(
-                first_name="Sarah",
-                last_name="Wilson",
-                position_id=3
-            )
+            {
+                "first_name": "John",
+                "last_name": "Doe",
+                "position_id": position_ids["Software Engineer"]
+            },
+            {
+                "first_name": "Jane",
+                "last_name": "Smith",
+                "position_id": position_ids["Product Manager"]
+            },
+            {
+                "first_name": "Mike",
+                "last_name": "Johnson",
+                "position_id": position_ids["Software Engineer"]
+            },
+            {
+                "first_name": "Sarah",
+                "last_name": "Wilson",
+                "position_id": position_ids["Data Scientist"]
+            }
         ]
-        
-        for employee in sample_employees:
-            db.add(employee)
+        db.execute(insert(Employee), sample_employees)
         
         db.commit()
         print("Sample data added successfully!")
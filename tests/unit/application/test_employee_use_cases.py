@@ -153,12 +153,46 @@ class TestEmployeeUseCases:
                 position_id=position_id
             )
 
+    @pytest.mark.asyncio
+    async def test_create_many_success(
+        self, employee_use_cases, mock_employee_repo, mock_position_repo, sample_position
+    ):
+        """Test batch creation checks positions with a single lookup"""
+        mock_position_repo.get_many_by_ids.return_value = {sample_position.id: sample_position}
+        mock_employee_repo.bulk_create.side_effect = lambda employees: employees
+        
+        result = await employee_use_cases.create_many([
+            {"first_name": "John", "last_name": "Doe", "position_id": sample_position.id},
+            {"first_name": "Jane", "last_name": "Smith", "position_id": sample_position.id},
+        ])
+        
+        assert [emp.first_name for emp in result] == ["John", "Jane"]
+        assert all(emp.position == sample_position for emp in result)
+        mock_position_repo.get_many_by_ids.assert_called_once()
+        mock_position_repo.get_by_id.assert_not_called()
+        mock_employee_repo.bulk_create.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_create_many_position_not_found(
+        self, employee_use_cases, mock_employee_repo, mock_position_repo, sample_position
+    ):
+        """Test batch creation fails before inserting when a position is missing"""
+        missing_id = uuid.uuid4()
+        mock_position_repo.get_many_by_ids.return_value = {sample_position.id: sample_position}
+        
+        with pytest.raises(ValueError, match=f"Position with ID {missing_id} not found"):
+            await employee_use_cases.create_many([
+                {"first_name": "John", "last_name": "Doe", "position_id": sample_position.id},
+                {"first_name": "Jane", "last_name": "Smith", "position_id": missing_id},
+            ])
+        
+        mock_employee_repo.bulk_create.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_update_employee_success(
         self, employee_use_cases, mock_employee_repo, mock_position_repo, sample_employee, sample_position
     ):
         """Test successful employee update"""
-        mock_employee_repo.get_by_id.return_value = sample_employee
         mock_position_repo.get_by_id.return_value = sample_position
         updated_employee = Employee(
             id=sample_employee.id,
@@ -169,7 +203,7 @@ class TestEmployeeUseCases:
             position_id=sample_position.id,
             position=sample_position
         )
-        mock_employee_repo.update.return_value = updated_employee
+        mock_employee_repo.update_if_exists.return_value = updated_employee
         
         result = await employee_use_cases.update_employee(
             employee_id=sample_employee.id,
@@ -179,9 +213,13 @@ class TestEmployeeUseCases:
         )
         
         assert result == updated_employee
-        mock_employee_repo.get_by_id.assert_called_once_with(sample_employee.id)
         mock_position_repo.get_by_id.assert_called_once_with(sample_position.id)
-        mock_employee_repo.update.assert_called_once()
+        mock_employee_repo.update_if_exists.assert_called_once()
+        mock_employee_repo.get_by_id.assert_not_called()
+        updated_entity = mock_employee_repo.update_if_exists.call_args.args[0]
+        assert updated_entity.id == sample_employee.id
+        assert updated_entity.first_name == "Jane"
+        assert updated_entity.position == sample_position
 
     @pytest.mark.asyncio
     async def test_update_employee_not_found(
@@ -189,7 +227,7 @@ class TestEmployeeUseCases:
     ):
         """Test employee update when employee not found"""
         employee_id = uuid.uuid4()
-        mock_employee_repo.get_by_id.return_value = None
+        mock_employee_repo.update_if_exists.return_value = None
         
         with pytest.raises(ValueError, match=f"Employee with ID {employee_id} not found"):
             await employee_use_cases.update_employee(
@@ -205,7 +243,6 @@ class TestEmployeeUseCases:
     ):
         """Test employee update when position not found"""
         position_id = uuid.uuid4()
-        mock_employee_repo.get_by_id.return_value = sample_employee
         mock_position_repo.get_by_id.return_value = None
         
         with pytest.raises(ValueError, match=f"Position with ID {position_id} not found"):
@@ -221,14 +258,13 @@ class TestEmployeeUseCases:
         self, employee_use_cases, mock_employee_repo, sample_employee
     ):
         """Test successful employee deletion"""
-        mock_employee_repo.get_by_id.return_value = sample_employee
         mock_employee_repo.delete.return_value = True
         
         result = await employee_use_cases.delete_employee(sample_employee.id)
         
         assert result is True
-        mock_employee_repo.get_by_id.assert_called_once_with(sample_employee.id)
         mock_employee_repo.delete.assert_called_once_with(sample_employee.id)
+        mock_employee_repo.get_by_id.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_delete_employee_not_found(
@@ -236,7 +272,7 @@ class TestEmployeeUseCases:
     ):
         """Test employee deletion when employee not found"""
         employee_id = uuid.uuid4()
-        mock_employee_repo.get_by_id.return_value = None
+        mock_employee_repo.delete.return_value = False
         
         with pytest.raises(ValueError, match=f"Employee with ID {employee_id} not found"):
             await employee_use_cases.delete_employee(employee_id)
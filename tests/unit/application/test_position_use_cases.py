@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock
 
 from app.application.use_cases.position_use_cases import PositionUseCases
 from app.domain.entities.employee import Position
+from app.domain.exceptions import NotFoundError
 
 
 class TestPositionUseCases:
@@ -79,7 +80,6 @@ class TestPositionUseCases:
         self, position_use_cases, mock_position_repo
     ):
         """Test successful position creation"""
-        mock_position_repo.get_by_name.return_value = None  # No existing position
         created_position = Position(
             id=uuid.uuid4(),
             created_at=datetime.utcnow(),
@@ -87,7 +87,7 @@ class TestPositionUseCases:
             name="Data Scientist",
             description="Analyzes data"
         )
-        mock_position_repo.create.return_value = created_position
+        mock_position_repo.create_if_unique.return_value = created_position
         
         result = await position_use_cases.create_position(
             name="Data Scientist",
@@ -95,8 +95,8 @@ class TestPositionUseCases:
         )
         
         assert result == created_position
-        mock_position_repo.get_by_name.assert_called_once_with("Data Scientist")
-        mock_position_repo.create.assert_called_once()
+        mock_position_repo.get_by_name.assert_not_called()
+        mock_position_repo.create_if_unique.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_create_position_invalid_name(
@@ -114,7 +114,7 @@ class TestPositionUseCases:
         self, position_use_cases, mock_position_repo, sample_position
     ):
         """Test position creation when name already exists"""
-        mock_position_repo.get_by_name.return_value = sample_position
+        mock_position_repo.create_if_unique.return_value = None  # Unique constraint hit
         
         with pytest.raises(ValueError, match="Position with name 'Software Engineer' already exists"):
             await position_use_cases.create_position(
@@ -127,7 +127,6 @@ class TestPositionUseCases:
         self, position_use_cases, mock_position_repo, sample_position
     ):
         """Test successful position update"""
-        mock_position_repo.get_by_id.return_value = sample_position
         mock_position_repo.get_by_name.return_value = None  # No conflict
         updated_position = Position(
             id=sample_position.id,
@@ -136,7 +135,7 @@ class TestPositionUseCases:
             name="Senior Software Engineer",
             description="Lead developer"
         )
-        mock_position_repo.update.return_value = updated_position
+        mock_position_repo.update_if_exists.return_value = updated_position
         
         result = await position_use_cases.update_position(
             position_id=sample_position.id,
@@ -145,8 +144,11 @@ class TestPositionUseCases:
         )
         
         assert result == updated_position
-        mock_position_repo.get_by_id.assert_called_once_with(sample_position.id)
-        mock_position_repo.update.assert_called_once()
+        mock_position_repo.update_if_exists.assert_called_once()
+        mock_position_repo.get_by_id.assert_not_called()
+        updated_entity = mock_position_repo.update_if_exists.call_args.args[0]
+        assert updated_entity.id == sample_position.id
+        assert updated_entity.name == "Senior Software Engineer"
 
     @pytest.mark.asyncio
     async def test_update_position_not_found(
@@ -154,7 +156,8 @@ class TestPositionUseCases:
     ):
         """Test position update when position not found"""
         position_id = uuid.uuid4()
-        mock_position_repo.get_by_id.return_value = None
+        mock_position_repo.get_by_name.return_value = None
+        mock_position_repo.update_if_exists.return_value = None
         
         with pytest.raises(ValueError, match=f"Position with ID {position_id} not found"):
             await position_use_cases.update_position(
@@ -176,7 +179,6 @@ class TestPositionUseCases:
             description="Another position"
         )
         
-        mock_position_repo.get_by_id.return_value = sample_position
         mock_position_repo.get_by_name.return_value = another_position
         
         with pytest.raises(ValueError, match="Position with name 'Existing Position' already exists"):
@@ -191,14 +193,13 @@ class TestPositionUseCases:
         self, position_use_cases, mock_position_repo, sample_position
     ):
         """Test successful position deletion"""
-        mock_position_repo.get_by_id.return_value = sample_position
         mock_position_repo.has_employees.return_value = False
         mock_position_repo.delete.return_value = True
         
         result = await position_use_cases.delete_position(sample_position.id)
         
         assert result is True
-        mock_position_repo.get_by_id.assert_called_once_with(sample_position.id)
+        mock_position_repo.get_by_id.assert_not_called()
         mock_position_repo.has_employees.assert_called_once_with(sample_position.id)
         mock_position_repo.delete.assert_called_once_with(sample_position.id)
 
@@ -208,9 +209,10 @@ class TestPositionUseCases:
     ):
         """Test position deletion when position not found"""
         position_id = uuid.uuid4()
-        mock_position_repo.get_by_id.return_value = None
+        mock_position_repo.has_employees.return_value = False
+        mock_position_repo.delete.return_value = False
         
-        with pytest.raises(ValueError, match=f"Position with ID {position_id} not found"):
+        with pytest.raises(NotFoundError, match=f"Position with ID {position_id} not found"):
             await position_use_cases.delete_position(position_id)
 
     @pytest.mark.asyncio
@@ -218,8 +220,8 @@ class TestPositionUseCases:
         self, position_use_cases, mock_position_repo, sample_position
     ):
         """Test position deletion when position has employees"""
-        mock_position_repo.get_by_id.return_value = sample_position
         mock_position_repo.has_employees.return_value = True
         
-        with pytest.raises(ValueError, match="Cannot delete position: employees are assigned to this position"):
-            await position_use_cases.delete_position(sample_position.id)
\ No newline at end of file
+        with pytest.raises(ValueError, match="Cannot delete position: employees are assigned to this position") as exc_info:
+            await position_use_cases.delete_position(sample_position.id)
+        assert not isinstance(exc_info.value, NotFoundError)
\ No newline at end of file
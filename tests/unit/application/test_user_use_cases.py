@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock
 
 from app.application.use_cases.user_use_cases import UserUseCases
 from app.domain.entities.employee import User
+from app.domain.exceptions import AlreadyExistsError
 
 
 class TestUserUseCases:
@@ -88,8 +89,6 @@ class TestUserUseCases:
         self, user_use_cases, mock_user_repo
     ):
         """Test successful user creation"""
-        mock_user_repo.get_by_username.return_value = None  # No existing user
-        mock_user_repo.get_by_email.return_value = None  # No existing email
         created_user = User(
             id=uuid.uuid4(),
             created_at=datetime.utcnow(),
@@ -99,7 +98,7 @@ class TestUserUseCases:
             password_hash="hashed_password",
             is_active=True
         )
-        mock_user_repo.create.return_value = created_user
+        mock_user_repo.create_if_unique.return_value = created_user
         
         result = await user_use_cases.create_user(
             username="newuser",
@@ -108,9 +107,9 @@ class TestUserUseCases:
         )
         
         assert result == created_user
-        mock_user_repo.get_by_username.assert_called_once_with("newuser")
-        mock_user_repo.get_by_email.assert_called_once_with("new@example.com")
-        mock_user_repo.create.assert_called_once()
+        mock_user_repo.get_by_username.assert_not_called()
+        mock_user_repo.get_by_email.assert_not_called()
+        mock_user_repo.create_if_unique.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_create_user_invalid_username(
@@ -136,34 +135,53 @@ class TestUserUseCases:
                 password_hash="hashed_password"
             )
 
+    @pytest.mark.asyncio
+    async def test_create_user_without_validation(
+        self, user_use_cases, mock_user_repo, sample_user
+    ):
+        """Test pre-validated input skips the domain format checks"""
+        mock_user_repo.create_if_unique.return_value = sample_user
+        
+        await user_use_cases.create_user(
+            username="carol.x",
+            email="carol@example.com",
+            password_hash="hashed_password",
+            validate=False
+        )
+        
+        assert mock_user_repo.create_if_unique.call_args.args[0].username == "carol.x"
+
     @pytest.mark.asyncio
     async def test_create_user_username_exists(
         self, user_use_cases, mock_user_repo, sample_user
     ):
         """Test user creation when username already exists"""
+        mock_user_repo.create_if_unique.return_value = None  # Unique constraint hit
         mock_user_repo.get_by_username.return_value = sample_user
         
-        with pytest.raises(ValueError, match="Username 'testuser' already exists"):
+        with pytest.raises(AlreadyExistsError, match="Username 'testuser' already exists") as exc_info:
             await user_use_cases.create_user(
                 username="testuser",
                 email="new@example.com",
                 password_hash="hashed_password"
             )
+        assert exc_info.value.field == "username"
 
     @pytest.mark.asyncio
     async def test_create_user_email_exists(
         self, user_use_cases, mock_user_repo, sample_user
     ):
         """Test user creation when email already exists"""
+        mock_user_repo.create_if_unique.return_value = None  # Unique constraint hit
         mock_user_repo.get_by_username.return_value = None  # Username is available
-        mock_user_repo.get_by_email.return_value = sample_user  # Email exists
         
-        with pytest.raises(ValueError, match="Email 'test@example.com' already exists"):
+        with pytest.raises(AlreadyExistsError, match="Email 'test@example.com' already exists") as exc_info:
             await user_use_cases.create_user(
                 username="newuser",
                 email="test@example.com",
                 password_hash="hashed_password"
             )
+        assert exc_info.value.field == "email"
 
     @pytest.mark.asyncio
     async def test_authenticate_user_success(
@@ -159,6 +159,25 @@ class TestEmployee:
         
         assert employee.full_name == "John Doe"
 
+    def test_employee_from_row(self):
+        """Test building an employee from stored values"""
+        employee_id = uuid.uuid4()
+        now = datetime.utcnow()
+        kwargs = dict(
+            id=employee_id,
+            created_at=now,
+            updated_at=now,
+            first_name="John",
+            last_name="Doe",
+            position_id=uuid.uuid4()
+        )
+        
+        employee = Employee.from_row(**kwargs)
+        
+        assert employee == Employee(**kwargs)
+        assert employee.full_name == "John Doe"
+        assert employee.position is None
+
     def test_employee_update_personal_info(self):
         """Test employee personal info update"""
         employee = Employee(
@@ -5,8 +5,11 @@ import pytest
 import uuid
 
 from app.domain.value_objects.common import (
-    Email, Username, PersonName, EntityId, PositionName
+    Email, Username, PersonName, EntityId, PositionName,
+    validate_email, validate_username, validate_person_name,
+    validate_position_name, validate_entity_id
 )
+from app.domain.value_objects.uuid_batch import uuid4_batch
 
 
 class TestEmail:
@@ -166,6 +169,12 @@ class TestEntityId:
         with pytest.raises(ValueError, match="Invalid UUID string"):
             EntityId.from_string("not-a-uuid")
 
+    def test_entity_id_from_bytes(self):
+        """Test entity ID creation from raw UUID bytes"""
+        uuid_value = uuid.uuid4()
+        entity_id = EntityId(uuid_value.bytes)
+        assert entity_id.value == uuid_value
+
     def test_invalid_entity_id_type(self):
         """Test invalid entity ID with wrong type"""
         with pytest.raises(ValueError, match="ID must be a valid UUID"):
@@ -221,4 +230,47 @@ class TestPositionName:
         """Test that position name is immutable"""
         name = PositionName("Software Engineer")
         with pytest.raises(AttributeError):
-            name.value = "New Position"
\ No newline at end of file
+            name.value = "New Position"
+
+
+class TestValidators:
+    """Test module-level validator functions"""
+
+    def test_validators_return_value_unchanged(self):
+        """Test validators return the validated value itself"""
+        entity_id = uuid.uuid4()
+        assert validate_email("test@example.com") == "test@example.com"
+        assert validate_username("testuser") == "testuser"
+        assert validate_person_name("O'Brien") == "O'Brien"
+        assert validate_position_name("R&D Lead") == "R&D Lead"
+        assert validate_entity_id(entity_id) is entity_id
+
+    def test_validators_raise_value_object_errors(self):
+        """Test validators raise the same errors as the value objects"""
+        with pytest.raises(ValueError, match="Invalid email format"):
+            validate_email("test@example")
+        with pytest.raises(ValueError, match="Invalid username"):
+            validate_username("ab")
+        with pytest.raises(ValueError, match="Invalid username"):
+            validate_username("testuser\n")
+        with pytest.raises(ValueError, match="Invalid name"):
+            validate_person_name("John123")
+        with pytest.raises(ValueError, match="Invalid position name"):
+            validate_position_name("")
+        with pytest.raises(ValueError, match="ID must be a valid UUID"):
+            validate_entity_id("not-a-uuid")
+
+
+class TestUuid4Batch:
+    """Test batched UUID generation"""
+
+    def test_uuid4_batch(self):
+        """Test batch yields distinct version 4 UUIDs"""
+        ids = uuid4_batch(50)
+        assert len(ids) == 50
+        assert len(set(ids)) == 50
+        assert all(i.version == 4 and i.variant == uuid.RFC_4122 for i in ids)
+
+    def test_uuid4_batch_empty(self):
+        """Test empty batch"""
+        assert uuid4_batch(0) == []
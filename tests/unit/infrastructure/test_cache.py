@@ -0,0 +1,290 @@
+"""
+Unit tests for Redis cached repositories with mocked Redis
+"""
+import pytest
+import uuid
+from dataclasses import replace
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.database import AfterCommitAsyncSession
+from app.domain.entities.employee import Position, User
+from app.infrastructure.cache.redis_cached_position_repo import (
+    CachedPositionRepository, invalidate_cached_position
+)
+from app.infrastructure.cache.redis_cached_user_repo import CachedUserRepository
+from app.infrastructure.cache.redis_list_cache import ListCache
+
+
+class TestCachedPositionRepository:
+    """Test CachedPositionRepository"""
+
+    @pytest.fixture
+    def mock_inner(self):
+        """Mock wrapped position repository"""
+        return AsyncMock()
+
+    @pytest.fixture
+    def mock_redis(self):
+        """Mock async Redis client"""
+        redis = AsyncMock()
+        redis.pipeline = MagicMock()
+        return redis
+
+    @pytest.fixture
+    def session(self):
+        """Unbound session; commit only runs the queued callbacks"""
+        return AfterCommitAsyncSession()
+
+    @pytest.fixture
+    def cached_repo(self, mock_inner, mock_redis, session):
+        """Cached position repository instance"""
+        return CachedPositionRepository(mock_inner, mock_redis, session)
+
+    @pytest.fixture
+    def sample_position(self):
+        """Sample position entity"""
+        return Position(
+            id=uuid.uuid4(),
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+            name="Software Engineer",
+            description="Develops software applications"
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_miss_populates_cache(
+        self, cached_repo, mock_inner, mock_redis, sample_position
+    ):
+        """Test a cache miss reads through and stores the position"""
+        mock_redis.get.return_value = None
+        mock_inner.get_by_id.return_value = sample_position
+        
+        result = await cached_repo.get_by_id(sample_position.id)
+        
+        assert result == sample_position
+        mock_inner.get_by_id.assert_called_once_with(sample_position.id)
+        mock_redis.setex.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_hit_skips_database(
+        self, cached_repo, mock_inner, mock_redis, sample_position
+    ):
+        """Test a cache hit is served without the wrapped repository"""
+        mock_redis.get.return_value = None
+        mock_inner.get_by_id.return_value = sample_position
+        await cached_repo.get_by_id(sample_position.id)
+        mock_redis.get.return_value = mock_redis.setex.call_args.args[2]
+        mock_inner.get_by_id.reset_mock()
+        
+        result = await cached_repo.get_by_id(sample_position.id)
+        
+        assert result == sample_position
+        mock_inner.get_by_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_delete_invalidates_after_commit(self, cached_repo, mock_inner, mock_redis, session):
+        """Test deleting a position drops its cache entry only once the session commits"""
+        position_id = uuid.uuid4()
+        mock_inner.delete.return_value = True
+        
+        result = await cached_repo.delete(position_id)
+        
+        assert result is True
+        mock_redis.delete.assert_not_called()
+        await session.commit()
+        mock_redis.delete.assert_called_once_with(f"pos:{position_id}")
+
+    @pytest.mark.asyncio
+    async def test_update_rolled_back_keeps_cache(
+        self, cached_repo, mock_inner, mock_redis, session, sample_position
+    ):
+        """Test a rolled back update leaves the cached position in place"""
+        mock_inner.update.return_value = sample_position
+        
+        await cached_repo.update(sample_position)
+        await session.rollback()
+        await session.commit()
+        
+        mock_redis.delete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_cached_position(self, mock_redis):
+        """Test writes outside the cached repository can drop the position entry"""
+        position_id = uuid.uuid4()
+        
+        with patch('app.infrastructure.cache.redis_cached_position_repo.get_redis', return_value=mock_redis):
+            await invalidate_cached_position(position_id)
+        
+        mock_redis.delete.assert_called_once_with(f"pos:{position_id}")
+
+
+class TestCachedUserRepository:
+    """Test CachedUserRepository"""
+
+    @pytest.fixture
+    def mock_inner(self):
+        """Mock wrapped user repository"""
+        return AsyncMock()
+
+    @pytest.fixture
+    def mock_redis(self):
+        """Mock async Redis client"""
+        redis = AsyncMock()
+        redis.pipeline = MagicMock()
+        redis.pipeline.return_value.execute = AsyncMock()
+        return redis
+
+    @pytest.fixture
+    def session(self):
+        """Unbound session; commit only runs the queued callbacks"""
+        return AfterCommitAsyncSession()
+
+    @pytest.fixture
+    def cached_repo(self, mock_inner, mock_redis, session):
+        """Cached user repository instance"""
+        return CachedUserRepository(mock_inner, mock_redis, session)
+
+    @pytest.fixture
+    def sample_user(self):
+        """Sample user entity"""
+        return User(
+            id=uuid.uuid4(),
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+            username="testuser",
+            email="test@example.com",
+            password_hash="hashed_password",
+            is_active=True
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_by_username_round_trip(
+        self, cached_repo, mock_inner, mock_redis, sample_user
+    ):
+        """Test a cached user deserializes to the same profile, without the password hash"""
+        mock_redis.get.return_value = None
+        mock_inner.get_by_username.return_value = sample_user
+        await cached_repo.get_by_username("testuser")
+        mock_redis.get.return_value = mock_redis.pipeline.return_value.setex.call_args.args[2]
+        
+        result = await cached_repo.get_by_username("testuser")
+        
+        assert result == replace(sample_user, password_hash="")
+        mock_inner.get_by_username.assert_called_once_with("testuser")
+
+    @pytest.mark.asyncio
+    async def test_cached_payloads_exclude_password_hash(
+        self, cached_repo, mock_inner, mock_redis, sample_user
+    ):
+        """Test neither cache key stores the password hash"""
+        mock_redis.get.return_value = None
+        mock_inner.get_by_username.return_value = sample_user
+        
+        await cached_repo.get_by_username("testuser")
+        
+        payloads = [c.args[2] for c in mock_redis.pipeline.return_value.setex.call_args_list]
+        assert len(payloads) == 2
+        for raw in payloads:
+            assert b"password_hash" not in raw
+            assert sample_user.password_hash.encode() not in raw
+
+    @pytest.mark.asyncio
+    async def test_update_invalidates(self, cached_repo, mock_inner, mock_redis, session, sample_user):
+        """Test updating a user drops both its username and ID keys after commit"""
+        mock_inner.update.return_value = sample_user
+        
+        await cached_repo.update(sample_user)
+        
+        mock_redis.delete.assert_not_called()
+        await session.commit()
+        mock_redis.delete.assert_called_once_with("user:testuser", f"user:id:{sample_user.id}")
+
+    @pytest.mark.asyncio
+    async def test_update_if_exists_invalidates(
+        self, cached_repo, mock_inner, mock_redis, session, sample_user
+    ):
+        """Test a conditional update drops both keys after commit"""
+        mock_inner.update_if_exists.return_value = sample_user
+        
+        await cached_repo.update_if_exists(sample_user)
+        
+        mock_redis.delete.assert_not_called()
+        await session.commit()
+        mock_redis.delete.assert_called_once_with("user:testuser", f"user:id:{sample_user.id}")
+
+    @pytest.mark.asyncio
+    async def test_delete_invalidates(self, cached_repo, mock_inner, mock_redis, session, sample_user):
+        """Test deleting a user drops both its username and ID keys after commit"""
+        mock_inner.get_by_id.return_value = sample_user
+        mock_inner.delete.return_value = True
+        
+        result = await cached_repo.delete(sample_user.id)
+        
+        assert result is True
+        mock_redis.delete.assert_not_called()
+        await session.commit()
+        mock_redis.delete.assert_called_once_with("user:testuser", f"user:id:{sample_user.id}")
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_hit_skips_database(self, cached_repo, mock_inner, mock_redis, sample_user):
+        """Test a user cached by username is also served by ID"""
+        mock_redis.get.return_value = None
+        mock_inner.get_by_username.return_value = sample_user
+        await cached_repo.get_by_username("testuser")
+        pipe = mock_redis.pipeline.return_value
+        assert [c.args[0] for c in pipe.setex.call_args_list] == [
+            "user:testuser", f"user:id:{sample_user.id}"
+        ]
+        mock_redis.get.return_value = pipe.setex.call_args.args[2]
+        
+        result = await cached_repo.get_by_id(sample_user.id)
+        
+        assert result == replace(sample_user, password_hash="")
+        mock_inner.get_by_id.assert_not_called()
+
+
+class TestListCache:
+    """Test ListCache"""
+
+    @pytest.fixture
+    def mock_redis(self):
+        """Mock async Redis client"""
+        redis = AsyncMock()
+        redis.pipeline = MagicMock()
+        redis.pipeline.return_value.execute = AsyncMock()
+        return redis
+
+    @pytest.fixture
+    def list_cache(self, mock_redis):
+        """Employee list cache instance"""
+        return ListCache(mock_redis, "emp:list")
+
+    @pytest.mark.asyncio
+    async def test_set_indexes_page(self, list_cache, mock_redis):
+        """Test storing a page also records its key for invalidation"""
+        await list_cache.set(0, 100, b"[]")
+        
+        pipe = mock_redis.pipeline.return_value
+        pipe.setex.assert_called_once_with("emp:list:0:100", 300, b"[]")
+        pipe.sadd.assert_called_once_with("emp:list:keys", "emp:list:0:100")
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_hit(self, list_cache, mock_redis):
+        """Test a cached page is returned as stored"""
+        mock_redis.get.return_value = b"[]"
+        
+        result = await list_cache.get(0, 100)
+        
+        assert result == b"[]"
+        mock_redis.get.assert_called_once_with("emp:list:0:100")
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_all_pages(self, list_cache, mock_redis):
+        """Test invalidation deletes every indexed page and the index"""
+        mock_redis.smembers.return_value = {b"emp:list:0:100"}
+        
+        await list_cache.invalidate()
+        
+        mock_redis.delete.assert_called_once_with("emp:list:keys", b"emp:list:0:100")
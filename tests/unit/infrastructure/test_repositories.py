@@ -4,13 +4,26 @@ Unit tests for repository implementations with mocked database
 import pytest
 import uuid
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+from sqlalchemy.exc import IntegrityError
 
 from app.infrastructure.repositories.employee_repository import EmployeeRepository
 from app.infrastructure.repositories.position_repository import PositionRepository
 from app.infrastructure.repositories.user_repository import UserRepository
 from app.infrastructure.database.models import EmployeeModel, PositionModel, UserModel
 from app.domain.entities.employee import Employee, Position, User
+from app.domain.interfaces.repositories import (
+    IEmployeeRepository, IPositionRepository, IUserRepository
+)
+
+
+def _mock_async_session():
+    """Mock AsyncSession: I/O methods are awaitable, results and add() are plain mocks"""
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=MagicMock())
+    for name in ("get", "flush", "commit", "refresh", "rollback"):
+        setattr(session, name, AsyncMock())
+    return session
 
 
 class TestEmployeeRepository:
@@ -19,7 +32,7 @@ class TestEmployeeRepository:
     @pytest.fixture
     def mock_db(self):
         """Mock database session"""
-        return MagicMock()
+        return _mock_async_session()
 
     @pytest.fixture
     def employee_repo(self, mock_db):
@@ -49,13 +62,7 @@ class TestEmployeeRepository:
     @pytest.mark.asyncio
     async def test_get_by_id_success(self, employee_repo, mock_db, mock_employee_model):
         """Test successful get employee by ID"""
-        mock_query = MagicMock()
-        mock_db.query.return_value = mock_query
-        mock_options = MagicMock()
-        mock_query.options.return_value = mock_options
-        mock_filter = MagicMock()
-        mock_options.filter.return_value = mock_filter
-        mock_filter.first.return_value = mock_employee_model
+        mock_db.get.return_value = mock_employee_model
         
         result = await employee_repo.get_by_id(mock_employee_model.id)
         
@@ -67,13 +74,7 @@ class TestEmployeeRepository:
     @pytest.mark.asyncio
     async def test_get_by_id_not_found(self, employee_repo, mock_db):
         """Test get employee by ID when not found"""
-        mock_query = MagicMock()
-        mock_db.query.return_value = mock_query
-        mock_options = MagicMock()
-        mock_query.options.return_value = mock_options
-        mock_filter = MagicMock()
-        mock_options.filter.return_value = mock_filter
-        mock_filter.first.return_value = None
+        mock_db.get.return_value = None
         
         result = await employee_repo.get_by_id(uuid.uuid4())
         
@@ -82,20 +83,51 @@ class TestEmployeeRepository:
     @pytest.mark.asyncio
     async def test_get_all(self, employee_repo, mock_db, mock_employee_model):
         """Test get all employees"""
-        mock_query = MagicMock()
-        mock_db.query.return_value = mock_query
-        mock_options = MagicMock()
-        mock_query.options.return_value = mock_options
-        mock_offset = MagicMock()
-        mock_options.offset.return_value = mock_offset
-        mock_limit = MagicMock()
-        mock_offset.limit.return_value = mock_limit
-        mock_limit.all.return_value = [mock_employee_model]
+        now = datetime.utcnow()
+        mock_db.execute.return_value.all.return_value = [(
+            mock_employee_model.id, now, now, "John", "Doe", mock_employee_model.position_id,
+            mock_employee_model.position_id, now, now, "Software Engineer", None
+        )]
         
         result = await employee_repo.get_all(skip=0, limit=100)
         
         assert len(result) == 1
         assert result[0].first_name == "John"
+        assert result[0].full_name == "John Doe"
+        assert result[0].position.name == "Software Engineer"
+        mock_db.query.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_all_shares_positions(self, employee_repo, mock_db):
+        """Test employees in the same position share one Position instance"""
+        now = datetime.utcnow()
+        position_id = uuid.uuid4()
+        mock_db.execute.return_value.all.return_value = [
+            (uuid.uuid4(), now, now, first_name, "Doe", position_id,
+             position_id, now, now, "Software Engineer", None)
+            for first_name in ("John", "Jane")
+        ]
+        
+        result = await employee_repo.get_all()
+        
+        assert result[0].position is result[1].position
+
+    @pytest.mark.asyncio
+    async def test_get_by_position_id(self, employee_repo, mock_db):
+        """Test employees by position are read from the column projection"""
+        now = datetime.utcnow()
+        position_id = uuid.uuid4()
+        mock_db.execute.return_value.all.return_value = [
+            (uuid.uuid4(), now, now, "John", "Doe", position_id,
+             position_id, now, now, "Software Engineer", None)
+        ]
+        
+        result = await employee_repo.get_by_position_id(position_id)
+        
+        assert len(result) == 1
+        assert result[0].position_id == position_id
+        assert result[0].position.name == "Software Engineer"
+        mock_db.execute.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_create_employee(self, employee_repo, mock_db, mock_employee_model):
@@ -109,26 +141,77 @@ class TestEmployeeRepository:
             position_id=mock_employee_model.position_id
         )
         
-        # Mock the database operations
-        mock_db.add = MagicMock()
-        mock_db.commit = MagicMock()
-        mock_db.refresh = MagicMock()
-        
-        # Mock the query for loading relationships
-        mock_query = MagicMock()
-        mock_db.query.return_value = mock_query
-        mock_options = MagicMock()
-        mock_query.options.return_value = mock_options
-        mock_filter = MagicMock()
-        mock_options.filter.return_value = mock_filter
-        mock_filter.first.return_value = mock_employee_model
-        
         result = await employee_repo.create(employee)
         
         mock_db.add.assert_called_once()
-        mock_db.commit.assert_called_once()
+        mock_db.flush.assert_awaited_once()
+        mock_db.commit.assert_not_called()
+        mock_db.refresh.assert_awaited_with(mock_db.add.call_args.args[0], ["position"])
         assert result.first_name == "John"
 
+    @pytest.mark.asyncio
+    async def test_create_employee_reuses_loaded_position(self, employee_repo, mock_db, mock_employee_model):
+        """Test creation returns the caller's position instead of reloading it"""
+        position = Position(
+            id=mock_employee_model.position_id,
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+            name="Data Scientist"
+        )
+        employee = Employee(
+            id=mock_employee_model.id,
+            created_at=mock_employee_model.created_at,
+            updated_at=mock_employee_model.updated_at,
+            first_name="John",
+            last_name="Doe",
+            position_id=position.id,
+            position=position
+        )
+        
+        result = await employee_repo.create(employee)
+        
+        assert result.position is position
+        mock_db.refresh.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_if_exists_success(self, employee_repo, mock_db, mock_employee_model):
+        """Test single-statement employee update"""
+        mock_db.execute.return_value.scalar_one_or_none.return_value = mock_employee_model
+        employee = Employee(
+            id=mock_employee_model.id,
+            created_at=None,
+            updated_at=mock_employee_model.updated_at,
+            first_name="John",
+            last_name="Doe",
+            position_id=mock_employee_model.position_id
+        )
+        
+        result = await employee_repo.update_if_exists(employee)
+        
+        assert result is not None
+        assert result.id == mock_employee_model.id
+        assert result.created_at == mock_employee_model.created_at
+        mock_db.execute.assert_called_once()
+        mock_db.query.assert_not_called()
+        mock_db.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_if_exists_not_found(self, employee_repo, mock_db):
+        """Test single-statement employee update when employee not found"""
+        mock_db.execute.return_value.scalar_one_or_none.return_value = None
+        employee = Employee(
+            id=uuid.uuid4(),
+            created_at=None,
+            updated_at=None,
+            first_name="John",
+            last_name="Doe",
+            position_id=uuid.uuid4()
+        )
+        
+        result = await employee_repo.update_if_exists(employee)
+        
+        assert result is None
+        mock_db.commit.assert_not_called()
 
 class TestPositionRepository:
     """Test Position repository implementation"""
@@ -136,7 +219,7 @@ class TestPositionRepository:
     @pytest.fixture
     def mock_db(self):
         """Mock database session"""
-        return MagicMock()
+        return _mock_async_session()
 
     @pytest.fixture
     def position_repo(self, mock_db):
@@ -157,11 +240,7 @@ class TestPositionRepository:
     @pytest.mark.asyncio
     async def test_get_by_id_success(self, position_repo, mock_db, mock_position_model):
         """Test successful get position by ID"""
-        mock_query = MagicMock()
-        mock_db.query.return_value = mock_query
-        mock_filter = MagicMock()
-        mock_query.filter.return_value = mock_filter
-        mock_filter.first.return_value = mock_position_model
+        mock_db.get.return_value = mock_position_model
         
         result = await position_repo.get_by_id(mock_position_model.id)
         
@@ -169,28 +248,90 @@ class TestPositionRepository:
         assert result.id == mock_position_model.id
         assert result.name == "Software Engineer"
 
+    @pytest.mark.asyncio
+    async def test_get_all(self, position_repo, mock_db):
+        """Test positions are read from the column projection"""
+        now = datetime.utcnow()
+        position_id = uuid.uuid4()
+        mock_db.execute.return_value.all.return_value = [
+            (position_id, now, now, "Software Engineer", "Develops software")
+        ]
+
+        result = await position_repo.get_all(skip=0, limit=100)
+
+        assert len(result) == 1
+        assert result[0].id == position_id
+        assert result[0].name == "Software Engineer"
+        assert result[0].description == "Develops software"
+
     @pytest.mark.asyncio
     async def test_get_by_name_success(self, position_repo, mock_db, mock_position_model):
         """Test successful get position by name"""
-        mock_query = MagicMock()
-        mock_db.query.return_value = mock_query
-        mock_filter = MagicMock()
-        mock_query.filter.return_value = mock_filter
-        mock_filter.first.return_value = mock_position_model
+        mock_db.execute.return_value.scalars.return_value.first.return_value = mock_position_model
         
         result = await position_repo.get_by_name("Software Engineer")
         
         assert result is not None
         assert result.name == "Software Engineer"
 
+    @pytest.mark.asyncio
+    async def test_update_if_exists_success(self, position_repo, mock_db, mock_position_model):
+        """Test single-statement position update"""
+        mock_db.execute.return_value.scalar_one_or_none.return_value = mock_position_model
+        position = Position(
+            id=mock_position_model.id,
+            created_at=None,
+            updated_at=mock_position_model.updated_at,
+            name="Software Engineer"
+        )
+        
+        result = await position_repo.update_if_exists(position)
+        
+        assert result is not None
+        assert result.name == "Software Engineer"
+        mock_db.query.assert_not_called()
+        mock_db.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_not_found(self, position_repo, mock_db):
+        """Test update raises from the single UPDATE when no row matches"""
+        mock_db.execute.return_value.scalar_one_or_none.return_value = None
+        position = Position(
+            id=uuid.uuid4(),
+            created_at=None,
+            updated_at=datetime.utcnow(),
+            name="Software Engineer"
+        )
+        
+        with pytest.raises(ValueError, match="not found"):
+            await position_repo.update(position)
+        
+        mock_db.get.assert_not_called()
+        mock_db.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_if_unique_duplicate_name(self, position_repo, mock_db):
+        """Test create_if_unique returns None when the name constraint is hit"""
+        mock_db.begin_nested.return_value.__aexit__.side_effect = IntegrityError(
+            "INSERT", {}, Exception("UNIQUE")
+        )
+        position = Position(
+            id=uuid.uuid4(),
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+            name="Software Engineer"
+        )
+        
+        result = await position_repo.create_if_unique(position)
+        
+        assert result is None
+        mock_db.rollback.assert_not_called()
+        mock_db.refresh.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_has_employees_true(self, position_repo, mock_db):
         """Test has_employees returns True when employees exist"""
-        mock_query = MagicMock()
-        mock_db.query.return_value = mock_query
-        mock_filter = MagicMock()
-        mock_query.filter.return_value = mock_filter
-        mock_filter.count.return_value = 5  # Has employees
+        mock_db.execute.return_value.scalar_one.return_value = True  # Has employees
         
         result = await position_repo.has_employees(uuid.uuid4())
         
@@ -199,11 +340,7 @@ class TestPositionRepository:
     @pytest.mark.asyncio
     async def test_has_employees_false(self, position_repo, mock_db):
         """Test has_employees returns False when no employees exist"""
-        mock_query = MagicMock()
-        mock_db.query.return_value = mock_query
-        mock_filter = MagicMock()
-        mock_query.filter.return_value = mock_filter
-        mock_filter.count.return_value = 0  # No employees
+        mock_db.execute.return_value.scalar_one.return_value = False  # No employees
         
         result = await position_repo.has_employees(uuid.uuid4())
         
@@ -216,7 +353,7 @@ class TestUserRepository:
     @pytest.fixture
     def mock_db(self):
         """Mock database session"""
-        return MagicMock()
+        return _mock_async_session()
 
     @pytest.fixture
     def user_repo(self, mock_db):
@@ -239,11 +376,7 @@ class TestUserRepository:
     @pytest.mark.asyncio
     async def test_get_by_username_success(self, user_repo, mock_db, mock_user_model):
         """Test successful get user by username"""
-        mock_query = MagicMock()
-        mock_db.query.return_value = mock_query
-        mock_filter = MagicMock()
-        mock_query.filter.return_value = mock_filter
-        mock_filter.first.return_value = mock_user_model
+        mock_db.execute.return_value.scalars.return_value.first.return_value = mock_user_model
         
         result = await user_repo.get_by_username("testuser")
         
@@ -254,11 +387,7 @@ class TestUserRepository:
     @pytest.mark.asyncio
     async def test_get_by_email_success(self, user_repo, mock_db, mock_user_model):
         """Test successful get user by email"""
-        mock_query = MagicMock()
-        mock_db.query.return_value = mock_query
-        mock_filter = MagicMock()
-        mock_query.filter.return_value = mock_filter
-        mock_filter.first.return_value = mock_user_model
+        mock_db.execute.return_value.scalars.return_value.first.return_value = mock_user_model
         
         result = await user_repo.get_by_email("test@example.com")
         
@@ -266,33 +395,59 @@ class TestUserRepository:
         assert result.username == "testuser"
         assert result.email == "test@example.com"
 
+    @pytest.mark.asyncio
+    async def test_repeat_lookups_served_from_identity_cache(self, user_repo, mock_db, mock_user_model):
+        """Test a loaded user is reused for later lookups by username, ID or email"""
+        mock_db.execute.return_value.scalars.return_value.first.return_value = mock_user_model
+        
+        user = await user_repo.get_by_username("testuser")
+        
+        assert await user_repo.get_by_username("testuser") is user
+        assert await user_repo.get_by_id(mock_user_model.id) is user
+        assert await user_repo.get_by_email("test@example.com") is user
+        mock_db.execute.assert_awaited_once()
+        mock_db.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_delete_evicts_identity_cache(self, user_repo, mock_db, mock_user_model):
+        """Test a deleted user is looked up again instead of served from the cache"""
+        mock_db.execute.return_value.scalars.return_value.first.return_value = mock_user_model
+        mock_db.execute.return_value.rowcount = 1
+        await user_repo.get_by_username("testuser")
+        
+        await user_repo.delete(mock_user_model.id)
+        mock_db.get.return_value = None
+        
+        assert await user_repo.get_by_id(mock_user_model.id) is None
+
     @pytest.mark.asyncio
     async def test_delete_user_success(self, user_repo, mock_db, mock_user_model):
         """Test successful user deletion"""
-        mock_query = MagicMock()
-        mock_db.query.return_value = mock_query
-        mock_filter = MagicMock()
-        mock_query.filter.return_value = mock_filter
-        mock_filter.first.return_value = mock_user_model
-        
-        mock_db.delete = MagicMock()
-        mock_db.commit = MagicMock()
+        mock_db.execute.return_value.rowcount = 1
         
         result = await user_repo.delete(mock_user_model.id)
         
         assert result is True
-        mock_db.delete.assert_called_once_with(mock_user_model)
-        mock_db.commit.assert_called_once()
+        mock_db.query.assert_not_called()
+        mock_db.execute.assert_called_once()
+        mock_db.commit.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_delete_user_not_found(self, user_repo, mock_db):
         """Test user deletion when user not found"""
-        mock_query = MagicMock()
-        mock_db.query.return_value = mock_query
-        mock_filter = MagicMock()
-        mock_query.filter.return_value = mock_filter
-        mock_filter.first.return_value = None
+        mock_db.execute.return_value.rowcount = 0
         
         result = await user_repo.delete(uuid.uuid4())
         
-        assert result is False
\ No newline at end of file
+        assert result is False
+
+
+class TestRepositoryInterfaces:
+    """Test repository implementations against the interface protocols"""
+
+    def test_repositories_satisfy_interfaces(self):
+        """Test implementations structurally satisfy the repository protocols"""
+        mock_db = MagicMock()
+        assert isinstance(EmployeeRepository(mock_db), IEmployeeRepository)
+        assert isinstance(PositionRepository(mock_db), IPositionRepository)
+        assert isinstance(UserRepository(mock_db), IUserRepository)
@@ -5,6 +5,7 @@ import pytest
 import uuid
 from datetime import datetime
 
+from app.domain.entities.employee import Employee, Position
 from app.infrastructure.schemas import (
     UserCreate, UserResponse, 
     PositionCreate, PositionResponse,
@@ -179,6 +180,7 @@ class TestSchemas:
         assert employee.first_name == "John"
         assert employee.last_name == "Doe"
         assert employee.position_id == position_id
+        assert employee.full_name == "John Doe"
         assert employee.position is not None
         assert employee.position.name == "Software Engineer"
 
@@ -202,6 +204,27 @@ class TestSchemas:
         assert employee.id == employee_id
         assert employee.position is None
 
+    def test_employee_response_from_domain_entity(self):
+        """Test EmployeeResponse validates a domain employee and its position directly"""
+        now = datetime.utcnow()
+        position = Position(id=uuid.uuid4(), created_at=now, updated_at=now, name="Software Engineer")
+        entity = Employee(
+            id=uuid.uuid4(),
+            created_at=now,
+            updated_at=now,
+            first_name="John",
+            last_name="Doe",
+            position_id=position.id,
+            position=position
+        )
+        
+        employee = EmployeeResponse.model_validate(entity)
+        
+        assert employee.id == entity.id
+        assert employee.full_name == "John Doe"
+        assert employee.position.id == position.id
+        assert employee.position.name == "Software Engineer"
+
     def test_token_schema(self):
         """Test Token schema"""
         token_data = {
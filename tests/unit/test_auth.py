@@ -4,13 +4,16 @@ Unit tests for auth module
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock
+import jwt
 
 from app.auth import (
     verify_password, get_password_hash, create_access_token, 
-    create_refresh_token, get_user_by_username, get_user_by_email,
-    create_user, authenticate_user
+    create_refresh_token, verify_password_async,
+    get_password_hash_async, decode_token, clear_token_cache,
+    get_user_use_cases, get_credential_use_cases
 )
-from app.models import User
+from app.infrastructure.cache.redis_cached_user_repo import CachedUserRepository
+from app.infrastructure.repositories.user_repository import UserRepository
 
 
 class TestAuthHelpers:
@@ -25,6 +28,28 @@ class TestAuthHelpers:
         assert verify_password(password, hashed) is True
         assert verify_password("wrong_password", hashed) is False
 
+    @pytest.mark.asyncio
+    @patch('app.auth.verify_password')
+    async def test_verify_password_async(self, mock_verify):
+        """Test async password verification delegates to the bcrypt pool"""
+        mock_verify.return_value = True
+        
+        result = await verify_password_async("password123", "hashed_password")
+        
+        assert result is True
+        mock_verify.assert_called_once_with("password123", "hashed_password")
+
+    @pytest.mark.asyncio
+    @patch('app.auth.get_password_hash')
+    async def test_get_password_hash_async(self, mock_get_password_hash):
+        """Test async password hashing delegates to the bcrypt pool"""
+        mock_get_password_hash.return_value = "hashed_password"
+        
+        result = await get_password_hash_async("password123")
+        
+        assert result == "hashed_password"
+        mock_get_password_hash.assert_called_once_with("password123")
+
     def test_create_access_token(self):
         """Test access token creation"""
         data = {"sub": "testuser"}
@@ -60,109 +85,49 @@ class TestAuthHelpers:
         assert len(token) > 0
 
 
-class TestDatabaseHelpers:
-    """Test database helper functions"""
+class TestTokenCache:
+    """Test cached JWT decoding"""
 
-    @patch('app.auth.User')
-    def test_get_user_by_username(self, mock_user):
-        """Test getting user by username"""
-        mock_db = MagicMock()
-        mock_query = MagicMock()
-        mock_db.query.return_value = mock_query
-        mock_filter = MagicMock()
-        mock_query.filter.return_value = mock_filter
-        mock_user_instance = MagicMock()
-        mock_filter.first.return_value = mock_user_instance
-        
-        result = get_user_by_username(mock_db, "testuser")
-        
-        mock_db.query.assert_called_once_with(mock_user)
-        assert result == mock_user_instance
-
-    @patch('app.auth.User')
-    def test_get_user_by_email(self, mock_user):
-        """Test getting user by email"""
-        mock_db = MagicMock()
-        mock_query = MagicMock()
-        mock_db.query.return_value = mock_query
-        mock_filter = MagicMock()
-        mock_query.filter.return_value = mock_filter
-        mock_user_instance = MagicMock()
-        mock_filter.first.return_value = mock_user_instance
-        
-        result = get_user_by_email(mock_db, "test@example.com")
-        
-        mock_db.query.assert_called_once_with(mock_user)
-        assert result == mock_user_instance
+    def setup_method(self):
+        clear_token_cache()
 
-    @patch('app.auth.get_password_hash')
-    @patch('app.auth.User')
-    def test_create_user(self, mock_user_class, mock_get_password_hash):
-        """Test user creation"""
-        mock_db = MagicMock()
-        mock_get_password_hash.return_value = "hashed_password"
-        mock_user_instance = MagicMock()
-        mock_user_class.return_value = mock_user_instance
+    def test_decode_token_is_cached(self):
+        """Test a validated token is only decoded once"""
+        token = create_access_token({"sub": "testuser"})
+        real_decode = jwt.decode
         
-        from app.schemas import UserCreate
-        user_data = UserCreate(
-            username="testuser",
-            email="test@example.com", 
-            password="password123"
-        )
+        with patch('app.auth.jwt.decode', wraps=real_decode) as mock_decode:
+            assert decode_token(token) == ("testuser", "access")
+            assert decode_token(token) == ("testuser", "access")
         
-        result = create_user(mock_db, user_data)
-        
-        mock_get_password_hash.assert_called_once_with("password123")
-        mock_user_class.assert_called_once_with(
-            username="testuser",
-            email="test@example.com",
-            password="hashed_password"  # The legacy field name used in the actual implementation
-        )
-        mock_db.add.assert_called_once_with(mock_user_instance)
-        mock_db.commit.assert_called_once()
-        mock_db.refresh.assert_called_once_with(mock_user_instance)
-        assert result == mock_user_instance
+        mock_decode.assert_called_once()
 
-    @patch('app.auth.verify_password')
-    @patch('app.auth.get_user_by_username')
-    def test_authenticate_user_success(self, mock_get_user, mock_verify):
-        """Test successful user authentication"""
-        mock_db = MagicMock()
-        mock_user = MagicMock()
-        mock_user.password = "hashed_password"  # Legacy field name
-        mock_get_user.return_value = mock_user
-        mock_verify.return_value = True
+    def test_clear_token_cache(self):
+        """Test clearing the cache forces a fresh decode"""
+        token = create_refresh_token({"sub": "testuser"})
+        decode_token(token)
+        clear_token_cache()
         
-        result = authenticate_user(mock_db, "testuser", "password123")
+        with patch('app.auth.jwt.decode', return_value={"sub": "other", "type": "refresh"}) as mock_decode:
+            assert decode_token(token) == ("other", "refresh")
         
-        mock_get_user.assert_called_once_with(mock_db, "testuser")
-        mock_verify.assert_called_once_with("password123", "hashed_password")
-        assert result == mock_user
+        mock_decode.assert_called_once()
 
-    @patch('app.auth.get_user_by_username')
-    def test_authenticate_user_not_found(self, mock_get_user):
-        """Test user authentication when user not found"""
-        mock_db = MagicMock()
-        mock_get_user.return_value = None
-        
-        result = authenticate_user(mock_db, "nonexistent", "password123")
-        
-        mock_get_user.assert_called_once_with(mock_db, "nonexistent")
-        assert result is False
 
-    @patch('app.auth.verify_password')
-    @patch('app.auth.get_user_by_username')
-    def test_authenticate_user_wrong_password(self, mock_get_user, mock_verify):
-        """Test user authentication with wrong password"""
-        mock_db = MagicMock()
-        mock_user = MagicMock()
-        mock_user.password = "hashed_password"  # Legacy field name
-        mock_get_user.return_value = mock_user
-        mock_verify.return_value = False
+class TestUseCaseDependencies:
+    """Test the user use case dependencies"""
+
+    @patch('app.auth.get_redis')
+    def test_user_use_cases_read_through_cache(self, mock_get_redis):
+        """Test profile lookups go through Redis when it is configured"""
+        use_cases = get_user_use_cases(MagicMock())
         
-        result = authenticate_user(mock_db, "testuser", "wrongpassword")
+        assert isinstance(use_cases._user_repository, CachedUserRepository)
+
+    @patch('app.auth.get_redis')
+    def test_credential_use_cases_bypass_cache(self, mock_get_redis):
+        """Test login reads password hashes from the database even with Redis configured"""
+        use_cases = get_credential_use_cases(MagicMock())
         
-        mock_get_user.assert_called_once_with(mock_db, "testuser")
-        mock_verify.assert_called_once_with("wrongpassword", "hashed_password")
-        assert result is False
\ No newline at end of file
+        assert isinstance(use_cases._user_repository, UserRepository)
+        mock_get_redis.assert_not_called()
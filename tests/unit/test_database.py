@@ -2,9 +2,18 @@
 Unit tests for database configuration
 """
 import pytest
+import uuid
 from unittest.mock import patch, MagicMock
 
-from app.database import get_db
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.database import Base, DB_POOL_SIZE, DB_POOL_TIMEOUT, async_engine, engine, get_db
+from app.infrastructure.database.models import (
+    GUID, EmployeeModel, PositionModel, convert_legacy_guid_columns
+)
 
 
 class TestDatabase:
@@ -44,4 +53,85 @@ class TestDatabase:
             pass
         
         # Session should still be closed despite exception
-        mock_db.close.assert_called_once()
\ No newline at end of file
+        mock_db.close.assert_called_once()
+
+
+class TestEngines:
+    """Test engine pool configuration"""
+
+    def test_async_engine_uses_queue_pool(self):
+        """Test the async engine pools connections instead of falling back to NullPool"""
+        assert isinstance(async_engine.pool, AsyncAdaptedQueuePool)
+        assert async_engine.pool.size() == DB_POOL_SIZE
+
+    def test_pool_timeout_applies_to_both_engines(self):
+        """Test DB_POOL_TIMEOUT reaches the queue pool behind each engine"""
+        assert isinstance(engine.pool, QueuePool)
+        assert engine.pool.timeout() == DB_POOL_TIMEOUT
+        assert async_engine.pool.timeout() == DB_POOL_TIMEOUT
+
+
+class TestGUID:
+    """Test the GUID column type"""
+
+    def test_bind_param_stores_raw_bytes(self):
+        """Test every accepted input binds as the 16 raw UUID bytes on SQLite"""
+        guid, dialect, value = GUID(), sqlite.dialect(), uuid.uuid4()
+        
+        for raw in (value, str(value), str(value).upper(), value.hex, value.bytes):
+            assert guid.process_bind_param(raw, dialect) == value.bytes
+
+    def test_result_value_round_trips(self):
+        """Test stored bytes load back as the original UUID"""
+        guid, dialect, value = GUID(), sqlite.dialect(), uuid.uuid4()
+        
+        stored = guid.process_bind_param(value, dialect)
+        
+        assert guid.process_result_value(stored, dialect) == value
+
+    def test_bind_param_rejects_invalid_string(self):
+        """Test a malformed 36-character string is still rejected"""
+        with pytest.raises(ValueError):
+            GUID().process_bind_param("z" * 36, sqlite.dialect())
+
+    def test_result_value_accepts_legacy_string(self):
+        """Test an unconverted 36-character string id still loads as a UUID"""
+        value = uuid.uuid4()
+        
+        assert GUID().process_result_value(str(value), sqlite.dialect()) == value
+
+
+class TestConvertLegacyGuidColumns:
+    """Test the one-off string-to-binary id conversion"""
+
+    def test_converts_string_ids_so_lookups_match(self):
+        """Test string ids and foreign keys become binary and are found by binary lookups"""
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        position_id, employee_id = uuid.uuid4(), uuid.uuid4()
+        with engine.begin() as conn:
+            conn.execute(text("INSERT INTO positions (id, name) VALUES (:id, 'Engineer')"),
+                         {"id": str(position_id)})
+            conn.execute(text(
+                "INSERT INTO employees (id, first_name, last_name, position_id) "
+                "VALUES (:id, 'Ada', 'Lovelace', :position_id)"
+            ), {"id": str(employee_id), "position_id": str(position_id)})
+        
+        with engine.begin() as conn:
+            assert convert_legacy_guid_columns(conn) == 3
+        
+        with Session(engine) as db:
+            employee = db.get(EmployeeModel, employee_id)
+            assert employee.position_id == position_id
+            assert db.scalar(select(PositionModel).where(PositionModel.id == position_id)) is not None
+
+    def test_second_run_is_noop(self):
+        """Test already-binary ids are left alone"""
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with Session(engine) as db:
+            db.add(PositionModel(name="Engineer"))
+            db.commit()
+        
+        with engine.begin() as conn:
+            assert convert_legacy_guid_columns(conn) == 0